@@ -0,0 +1,52 @@
+# ruff: noqa: ANN201, T201
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from rxio import rx, rx_max, rx_mean, rx_min, rx_sum
+from rxio.rx import Rx, RxMap
+
+
+N = 10_000
+UPDATES = 1_000
+
+
+def _naive(func: Callable[[tuple[Any, ...]], Any]) -> Callable[..., Any]:
+    def aggregate(*xs: Any) -> Any:
+        return func(xs)
+
+    aggregate.__name__ = func.__name__
+    return aggregate
+
+
+def _bench(name: str, node: Rx[Any], xs: list[Any]) -> float:
+    def update() -> None:
+        for i in range(UPDATES):
+            xs[i * 7919 % N] += 1
+            node.__rx_get__()
+
+    seconds = min(timeit.repeat(update, number=1, repeat=3))
+    print(f'{name:>12}: {seconds / UPDATES * 1e6:10.2f} us / update')
+    return seconds
+
+
+def benchmark_aggregates():
+    print(f'{N} inputs, {UPDATES} single-input updates + reads')
+    for func, incremental in [
+        (sum, rx_sum),
+        (min, rx_min),
+        (max, rx_max),
+        (lambda xs: sum(xs) / len(xs), rx_mean),
+    ]:
+        xs = [rx(i) for i in range(N)]
+        t_naive = _bench('naive', RxMap(_naive(func), *xs), xs)
+
+        xs = [rx(i) for i in range(N)]
+        t_incr = _bench(incremental.__name__, incremental(*xs), xs)
+
+        print(f'{'speedup':>12}: {t_naive / t_incr:10.1f}x')
+        print()
+
+
+benchmark_aggregates()
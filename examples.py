@@ -24,8 +24,6 @@ def example_pythagoras():
 
 
 def example_zero_division():
-    # TODO: use exception groups for multiple errors
-
     a = rx(-1)
     b = rx(4)
     c = a / b
@@ -43,6 +41,18 @@ def example_zero_division():
     print(f'{b = }')
     print(f'{c = }')
 
+    print()
+    print('float(c)')
+    try:
+        print(float(c))
+    except ZeroDivisionError as e:
+        # the exception is cached, until `a` or `b` changes
+        print(repr(e))
+
+    print()
+    print('b += 2')
+    b += 2
+
     print()
     print('float(c)')
     print(float(c))
@@ -1,11 +1,49 @@
 __all__ = (
     '__version__',
+    'batch',
+    'effect',
+    'interning',
+    'memory_budget',
+    'parallel',
+    'pin',
     'rx',
+    'rx_count',
+    'rx_evaluate',
+    'rx_ewma',
+    'rx_max',
+    'rx_mean',
+    'rx_min',
+    'rx_rolling_max',
+    'rx_rolling_mean',
+    'rx_rolling_min',
+    'rx_rolling_var',
+    'rx_sum',
+    'snapshot',
+    'unpin',
 )
 
 from importlib import metadata as _metadata
 
-from .rx import rx
+from ._aggregate import rx_count, rx_max, rx_mean, rx_min, rx_sum
+from ._rolling import (
+    rx_ewma,
+    rx_rolling_max,
+    rx_rolling_mean,
+    rx_rolling_min,
+    rx_rolling_var,
+)
+from ._scenarios import rx_evaluate
+from .rx import (
+    batch,
+    effect,
+    interning,
+    memory_budget,
+    parallel,
+    pin,
+    rx,
+    snapshot,
+    unpin,
+)
 
 
 __version__ = _metadata.version(__package__ or __file__.split('/')[-1])
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+
+__all__ = ('rx_count', 'rx_max', 'rx_mean', 'rx_min', 'rx_sum')
+
+import contextlib
+import heapq
+from typing import TYPE_CHECKING, Any, ClassVar, cast, final, override
+
+from ._state import Raised
+from ._summation import CompensatedSum
+from .rx import Rx, RxMap
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class RxAggregate[Y](RxMap[Y]):
+    """
+    Incrementally updated aggregate over many inputs.
+
+    Instead of re-reading all inputs when one of them changes, the old and new
+    values of the changed input are used to update an accumulator.
+    """
+
+    __slots__ = ('_dirty', '_failed', '_indices', '_values')
+
+    # the values that are currently accumulated
+    _values: list[Any]
+    # first base index of a parent -> all of its base indices
+    _indices: dict[int, list[int]]
+    # base indices of the parents that were invalidated, but not yet pulled
+    _dirty: set[int]
+    _failed: dict[int, Raised]
+
+    @override
+    def __init__(
+        self,
+        func: Callable[..., Y],
+        /,
+        *rx_args: Rx[Any] | Any,
+    ) -> None:
+        first_index: dict[int, int] = {}
+        self._indices = {}
+        for i, arg in enumerate(rx_args):
+            if isinstance(arg, Rx):
+                j = first_index.setdefault(id(arg), i)
+                self._indices.setdefault(j, []).append(i)
+
+        self._dirty = set()
+        self._failed = {}
+        self._values = []
+
+        super().__init__(func, *rx_args)
+
+    @override
+    def _rx_start(self, args: list[Any], /) -> Y:
+        self._values = args
+        self._init()
+        return self._result()
+
+    def _init(self, /) -> None:
+        """(Re)initializes the accumulator from the current values."""
+        raise NotImplementedError
+
+    def _replace(self, index: int, old: Any, new: Any, /) -> None:
+        raise NotImplementedError
+
+    def _result(self, /) -> Y:
+        raise NotImplementedError
+
+    def _push(self, base_index: int, value: Any, /) -> None:
+        for i in self._indices[base_index]:
+            if isinstance(value, Raised):
+                # keep the last valid value accumulated, until it recovers
+                self._failed[i] = value
+                continue
+
+            self._failed.pop(i, None)
+            old, self._values[i] = self._values[i], value
+            self._replace(i, old, value)
+
+    @override
+    def __rx_invalidate__(self, base_index: int, value: Any = ..., /) -> None:
+        if value is Ellipsis:
+            self._dirty.add(base_index)
+        else:
+            self._dirty.discard(base_index)
+            self._push(base_index, value)
+
+        super().__rx_invalidate__(base_index, value)
+
+    @override
+    def _rx_compute(self, /) -> Y:
+        # the pulled parents push their new value (or failure) to us
+        for i in sorted(self._dirty):
+            with contextlib.suppress(Exception):
+                self._rx_parents[i].__rx_get__()
+        assert not self._dirty
+
+        failures = (self._failed[i] for i in sorted(self._failed))
+        if (failed := Raised.combine(failures, repr(self))) is not None:
+            failed.reraise()
+        return self._result()
+
+
+class RxSum[Y](RxAggregate[Y]):
+    """
+    O(1) updates of the sum of the inputs.
+
+    Float sums are compensated, and non-finite inputs are counted separately,
+    see `CompensatedSum`.
+    """
+
+    __slots__ = ('_total',)
+
+    _total: CompensatedSum
+
+    @override
+    def __init__(
+        self,
+        func: Callable[..., Y],
+        /,
+        *rx_args: Rx[Any] | Any,
+    ) -> None:
+        self._total = CompensatedSum()
+        super().__init__(func, *rx_args)
+
+    @override
+    def _init(self, /) -> None:
+        self._total = CompensatedSum(self._values)
+
+    @override
+    def _replace(self, index: int, old: Any, new: Any, /) -> None:
+        self._total.remove(old)
+        self._total.add(new)
+        if self._total.overflowed:
+            # e.g. `inf - x` remains `inf`, even if `x` caused the overflow
+            self._init()
+
+    @override
+    def _result(self, /) -> Y:
+        return cast(Y, self._total.value())
+
+
+@final
+class RxMean(RxSum[float]):
+    """O(1) updates of the arithmetic mean of the inputs."""
+
+    __slots__ = ()
+
+    @override
+    def _result(self, /) -> float:
+        return self._total.value() / len(self._values)
+
+
+@final
+class RxCount(RxAggregate[int]):
+    """O(1) updates of the amount of truthy inputs."""
+
+    __slots__ = ('_count',)
+
+    _count: int
+
+    @override
+    def __init__(
+        self,
+        func: Callable[..., int],
+        /,
+        *rx_args: Rx[Any] | Any,
+    ) -> None:
+        self._count = 0
+        super().__init__(func, *rx_args)
+
+    @override
+    def _init(self, /) -> None:
+        self._count = sum(map(bool, self._values))
+
+    @override
+    def _replace(self, index: int, old: Any, new: Any, /) -> None:
+        self._count += bool(new) - bool(old)
+
+    @override
+    def _result(self, /) -> int:
+        return self._count
+
+
+@final
+class _Desc[V]:
+    """Reverses the order, so that `heapq` can be used as a max-heap."""
+
+    __slots__ = ('value',)
+
+    value: V
+
+    def __init__(self, value: V, /) -> None:
+        self.value = value
+
+    def __lt__(self, other: _Desc[V], /) -> bool:
+        return other.value < self.value  # type: ignore[operator]
+
+
+class RxHeap[Y](RxAggregate[Y]):
+    """
+    O(log N) updates of the min or max, using a heap with lazy deletion.
+    The stale entries are discarded once they reach the top of the heap, or
+    when the heap has grown too large.
+    """
+
+    __slots__ = ('_heap', '_versions')
+
+    is_max: ClassVar[bool] = False
+
+    # entries of (key, base index, version)
+    _heap: list[tuple[Any, int, int]]
+    _versions: list[int]
+
+    @override
+    def __init__(
+        self,
+        func: Callable[..., Y],
+        /,
+        *rx_args: Rx[Any] | Any,
+    ) -> None:
+        self._heap, self._versions = [], []
+        super().__init__(func, *rx_args)
+
+    def _key(self, value: Any, /) -> Any:
+        return _Desc(value) if self.is_max else value
+
+    @override
+    def _init(self, /) -> None:
+        self._versions = [0] * len(self._values)
+        self._heap = [(self._key(v), i, 0) for i, v in enumerate(self._values)]
+        heapq.heapify(self._heap)
+
+    @override
+    def _replace(self, index: int, old: Any, new: Any, /) -> None:
+        self._versions[index] += 1
+        if len(self._heap) >= 2 * len(self._values):
+            # compaction, amortized O(1)
+            self._init()
+        else:
+            entry = self._key(new), index, self._versions[index]
+            heapq.heappush(self._heap, entry)
+
+    @override
+    def _result(self, /) -> Y:
+        heap, versions = self._heap, self._versions
+        while versions[heap[0][1]] != heap[0][2]:
+            heapq.heappop(heap)
+        return cast(Y, self._values[heap[0][1]])
+
+
+@final
+class RxMin[Y](RxHeap[Y]):
+    __slots__ = ()
+    is_max: ClassVar[bool] = False
+
+
+@final
+class RxMax[Y](RxHeap[Y]):
+    __slots__ = ()
+    is_max: ClassVar[bool] = True
+
+
+def _sum(*xs: Any) -> Any:
+    return sum(xs)
+
+
+def _count(*xs: object) -> int:
+    return sum(map(bool, xs))
+
+
+def _mean(*xs: Any) -> float:
+    return sum(xs) / len(xs)
+
+
+def _min(*xs: Any) -> Any:
+    return min(xs)
+
+
+def _max(*xs: Any) -> Any:
+    return max(xs)
+
+
+def rx_sum[Y](*xs: Rx[Y] | Y) -> RxSum[Y]:
+    """
+    The reactive sum of the inputs, that is updated in O(1) time when one of
+    the inputs changes.
+
+    Examples:
+        >>> from rxio import rx
+        >>> xs = [rx(i) for i in range(1, 5)]
+        >>> total = rx_sum(*xs)
+        >>> int(total)
+        10
+        >>> xs[0] += 10
+        >>> int(total)
+        20
+
+    """
+    return RxSum(_sum, *xs)
+
+
+def rx_count(*xs: Rx[object] | object) -> RxCount:
+    """
+    The reactive amount of truthy inputs, that is updated in O(1) time when
+    one of the inputs changes.
+    """
+    return RxCount(_count, *xs)
+
+
+def rx_mean[Y](*xs: Rx[Y] | Y) -> RxMean:
+    """
+    The reactive arithmetic mean of the inputs, that is updated in O(1) time
+    when one of the inputs changes.
+    """
+    return RxMean(_mean, *xs)
+
+
+def rx_min[Y](*xs: Rx[Y] | Y) -> RxMin[Y]:
+    """
+    The reactive minimum of the inputs, that is updated in O(log N) time when
+    one of the inputs changes.
+
+    Examples:
+        >>> from rxio import rx
+        >>> xs = [rx(i) for i in (3, 1, 4, 1, 5)]
+        >>> lo, hi = rx_min(*xs), rx_max(*xs)
+        >>> int(lo), int(hi)
+        (1, 5)
+        >>> xs[1] += 8
+        >>> xs[3] -= 2
+        >>> int(lo), int(hi)
+        (-1, 9)
+
+    """
+    return RxMin(_min, *xs)
+
+
+def rx_max[Y](*xs: Rx[Y] | Y) -> RxMax[Y]:
+    """
+    The reactive maximum of the inputs, that is updated in O(log N) time when
+    one of the inputs changes.
+    """
+    return RxMax(_max, *xs)
@@ -0,0 +1,115 @@
+__all__ = ('LRUCache',)
+
+import collections
+import sys
+import threading
+import weakref
+from typing import Any, Protocol, final
+
+from optype import CanCall
+
+
+class CanEvict(Protocol):
+    def __rx_evict__(self, /) -> bool: ...
+
+
+@final
+class LRUCache:
+    """
+    Keeps track of the (estimated) memory that is used by the cached values
+    of derived nodes. Once the budget is exceeded, the cached values of the
+    least recently used nodes are evicted, unless they're pinned.
+
+    The nodes are referenced weakly, and by their `id`.
+    """
+
+    __slots__ = ('_entries', '_lock', '_pinned', '_total', 'budget', 'sizeof')
+
+    budget: int | None
+    sizeof: CanCall[[Any], int]
+
+    _entries: collections.OrderedDict[int, tuple[weakref.ref[CanEvict], int]]
+    _pinned: dict[int, weakref.ref[CanEvict]]
+    _total: int
+    _lock: threading.RLock
+
+    def __init__(self, /) -> None:
+        self.budget = None
+        self.sizeof = sys.getsizeof
+
+        self._entries = collections.OrderedDict()
+        self._pinned = {}
+        self._total = 0
+        self._lock = threading.RLock()
+
+    @property
+    def total(self, /) -> int:
+        """The estimated amount of bytes of the tracked cached values."""
+        return self._total
+
+    def _remove(self, key: int, /) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._total -= entry[1]
+
+    def _discard_ref(self, key: int, /) -> CanCall[[Any], None]:
+        def callback(_: Any, /) -> None:
+            with self._lock:
+                self._remove(key)
+                self._pinned.pop(key, None)
+
+        return callback
+
+    def add(self, node: CanEvict, value: object, /) -> None:
+        """Track the newly computed value, and evict if over budget."""
+        if (budget := self.budget) is None:
+            return
+
+        key, size = id(node), self.sizeof(value)
+        with self._lock:
+            self._remove(key)
+            ref = weakref.ref(node, self._discard_ref(key))
+            self._entries[key] = ref, size
+            self._total += size
+
+            if self._total > budget:
+                self._evict(budget, exclude=key)
+
+    def touch(self, node: CanEvict, /) -> None:
+        """Mark the node as most recently used."""
+        with self._lock:
+            if (key := id(node)) in self._entries:
+                self._entries.move_to_end(key)
+
+    def discard(self, node: CanEvict, /) -> None:
+        """Stop tracking the node, e.g. once its value is invalidated."""
+        with self._lock:
+            self._remove(id(node))
+
+    def pin(self, node: CanEvict, /) -> None:
+        key = id(node)
+        with self._lock:
+            self._pinned[key] = weakref.ref(node, self._discard_ref(key))
+
+    def unpin(self, node: CanEvict, /) -> None:
+        with self._lock:
+            self._pinned.pop(id(node), None)
+
+    def _evict(self, budget: int, /, exclude: int) -> None:
+        for key, (ref, _) in list(self._entries.items()):
+            if self._total <= budget:
+                break
+            if key == exclude or key in self._pinned:
+                continue
+
+            self._remove(key)
+            if (node := ref()) is not None:
+                node.__rx_evict__()
+
+    def resize(self, budget: int | None, /) -> None:
+        with self._lock:
+            self.budget = budget
+            if budget is None:
+                self._entries.clear()
+                self._total = 0
+            elif self._total > budget:
+                self._evict(budget, exclude=-1)
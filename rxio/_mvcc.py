@@ -0,0 +1,167 @@
+__all__ = ('VersionStore',)
+
+import bisect
+import collections
+import contextlib
+import threading
+import weakref
+from collections.abc import Generator
+from operator import itemgetter
+from typing import Any, Protocol, final
+
+from optype import CanCall
+
+from ._state import StateVar
+
+
+class HasState(Protocol):
+    @property
+    def __rx_state__(self, /) -> StateVar[Any]: ...
+
+
+_version_of: CanCall[[tuple[int, Any]], int] = itemgetter(0)
+
+
+@final
+class VersionStore:
+    """
+    Multi-version concurrency control of the source variables.
+
+    While there are open snapshots, each write is assigned a new version, and
+    the `(version, value)` items of the written variables are retained. Once
+    no snapshot needs an old item anymore, it is garbage-collected.
+
+    Writers and readers only hold the lock briefly, i.e. readers don't block
+    writers for the duration of their snapshot. Opening a snapshot waits for
+    the writes that are still propagating to the children, so that the live
+    values are consistent with its version.
+    """
+
+    __slots__ = (
+        '_chains',
+        '_idle',
+        '_lock',
+        '_snapshots',
+        '_writing',
+        'version',
+    )
+
+    version: int
+
+    # open snapshot versions -> amount of snapshots
+    _snapshots: collections.Counter[int]
+    # id of a variable -> its weakref and retained (version, value) items
+    _chains: dict[int, tuple[weakref.ref[HasState], list[tuple[int, Any]]]]
+    # the amount of writes that are still propagating
+    _writing: int
+    _lock: threading.RLock
+    _idle: threading.Condition
+
+    def __init__(self, /) -> None:
+        self.version = 0
+        self._snapshots = collections.Counter()
+        self._chains = {}
+        self._writing = 0
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+
+    def open(self, /) -> int:
+        """Registers a new snapshot, and returns its version."""
+        with self._lock:
+            version = self.version
+            # from now on, the writes are versioned
+            self._snapshots[version] += 1
+            self._idle.wait_for(lambda: not self._writing)
+            return version
+
+    def close(self, version: int, /) -> None:
+        """Unregisters the snapshot, and prunes the unneeded versions."""
+        with self._lock:
+            self._snapshots[version] -= 1
+            if self._snapshots[version] <= 0:
+                del self._snapshots[version]
+            self._prune()
+
+    def _prune(self, /) -> None:
+        if not self._snapshots:
+            self._chains.clear()
+            return
+
+        oldest = min(self._snapshots)
+        for key, (ref, chain) in list(self._chains.items()):
+            # the last item that is visible to the oldest snapshot
+            start = max(bisect.bisect_right(chain, oldest, key=_version_of), 1)
+            if start >= len(chain):
+                # only the current value is needed
+                del self._chains[key]
+            elif start > 1:
+                # replaced instead of mutated, so readers can skip the lock
+                self._chains[key] = ref, chain[start - 1:]
+
+    def _discard_ref(self, key: int, /) -> CanCall[[Any], None]:
+        def callback(_: Any, /) -> None:
+            with self._lock:
+                self._chains.pop(key, None)
+
+        return callback
+
+    @contextlib.contextmanager
+    def write(
+        self,
+        var: HasState,
+        value: Any,
+        /,
+    ) -> Generator[bool, None, None]:
+        """
+        Sets the value of the variable, and retains its previous value if
+        there are open snapshots. Yields whether the value changed, so that
+        the change can be propagated within this context.
+        """
+        with self._lock:
+            if changed := self._set(var, value):
+                self._writing += 1
+        try:
+            yield changed
+        finally:
+            if changed:
+                with self._lock:
+                    self._writing -= 1
+                    self._idle.notify_all()
+
+    def _set(self, var: HasState, value: Any, /) -> bool:
+        state = var.__rx_state__
+        if not self._snapshots:
+            return state.set(value)[1]
+
+        # the version is incremented before the new value is visible, so that
+        # the (lock-free) readers that see it, also see the new version
+        old = state.get()
+        self.version += 1
+        changed = False
+        try:
+            changed = state.set(value)[1]
+        finally:
+            if not changed:
+                # nothing was written, and the lock is still held
+                self.version -= 1
+        if not changed:
+            return False
+
+        key = id(var)
+        if (entry := self._chains.get(key)) is None:
+            # the old value is visible to all open snapshots
+            ref = weakref.ref(var, self._discard_ref(key))
+            entry = self._chains[key] = ref, [(-1, old)]
+        entry[1].append((self.version, value))
+        return True
+
+    def read(self, var: HasState, version: int, /) -> Any:
+        """The value of the variable as of the given version."""
+        with self._lock:
+            if (entry := self._chains.get(id(var))) is None:
+                return var.__rx_state__.get()
+            chain = entry[1]
+
+        index = bisect.bisect_right(chain, version, key=_version_of) - 1
+        assert index >= 0
+        return chain[index][1]
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+
+__all__ = (
+    'rx_ewma',
+    'rx_rolling_max',
+    'rx_rolling_mean',
+    'rx_rolling_min',
+    'rx_rolling_var',
+)
+
+import collections
+import contextlib
+import math
+from typing import TYPE_CHECKING, Any, ClassVar, cast, final, override
+
+from ._state import Raised
+from ._summation import CompensatedSum
+from .rx import RxMap
+
+
+if TYPE_CHECKING:
+    from .rx import Rx
+
+
+class RxRolling[Y](RxMap[Y]):
+    """
+    Incrementally updated statistic over the most recent values of its input.
+
+    Each new value of the input is pushed to the statistic, so it's updated
+    in O(1) (amortized) time, using constant memory. The initial values are
+    taken from the retained history of the input, e.g. `rx(x, history=n)`.
+
+    Derived inputs are sampled, i.e. their value is added once read.
+    """
+
+    __slots__ = ()
+
+    name: ClassVar[str]
+    is_pure: ClassVar[bool] = False
+
+    @override
+    def __init__(self, x: Rx[Any], /, *params: Any) -> None:
+        super().__init__(self._start, x, *params)
+
+    def _start(self, x: Any, /, *_params: Any) -> Y:
+        history = self._rx_parents[0].__rx_state__.history()
+        assert history[-1][1] == x
+        for _, value in history:
+            self._add(value)
+        return self._result()
+
+    def _add(self, value: Any, /) -> None:
+        raise NotImplementedError
+
+    def _result(self, /) -> Y:
+        raise NotImplementedError
+
+    @override
+    def __rx_invalidate__(self, base_index: int, value: Any = ..., /) -> None:
+        if value is not Ellipsis and not isinstance(value, Raised):
+            self._add(value)
+        super().__rx_invalidate__(base_index, value)
+
+    @override
+    def _rx_compute(self, /) -> Y:
+        base = self.__rx_bases__[0]
+        if base.get() is Ellipsis:
+            # the input pushes its new value (or failure) to us
+            with contextlib.suppress(Exception):
+                self._rx_parents[0].__rx_get__()
+
+        # also if the failure was pushed when another node pulled the input
+        if isinstance(failed := base.get(), Raised):
+            failed.reraise()
+        return self._result()
+
+    @override
+    def __repr__(self) -> str:
+        return f'{self.name}({', '.join(map(repr, self._get_params()))})'
+
+
+class RxWindow[Y](RxRolling[Y]):
+    """Rolling statistic over a fixed-size window of the most recent values."""
+
+    __slots__ = ('_values', 'window')
+
+    window: int
+    _values: collections.deque[Any]
+
+    @override
+    def __init__(self, x: Rx[Any], window: int, /, *params: Any) -> None:
+        if window < 1:
+            raise ValueError('window must be >=1')
+
+        self.window = window
+        self._values = collections.deque(maxlen=window)
+        super().__init__(x, window, *params)
+
+    @override
+    def _add(self, value: Any, /) -> None:
+        values = self._values
+        if len(values) == self.window:
+            old = values[0]
+            values.append(value)
+            self._replace(old, value)
+        else:
+            values.append(value)
+            self._append(value)
+
+    def _append(self, new: Any, /) -> None:
+        """Called after `new` was added to the (not yet full) window."""
+        raise NotImplementedError
+
+    def _replace(self, old: Any, new: Any, /) -> None:
+        """Called after `new` was added to the window, evicting `old`."""
+        raise NotImplementedError
+
+
+@final
+class RxRollingMean(RxWindow[float]):
+    """The rolling mean, using the compensated sum of the window."""
+
+    __slots__ = ('_total',)
+
+    name: ClassVar[str] = 'rx_rolling_mean'
+
+    _total: CompensatedSum
+
+    @override
+    def __init__(self, x: Rx[Any], window: int, /) -> None:
+        self._total = CompensatedSum()
+        super().__init__(x, window)
+
+    @override
+    def _append(self, new: Any, /) -> None:
+        self._total.add(new)
+
+    @override
+    def _replace(self, old: Any, new: Any, /) -> None:
+        self._total.remove(old)
+        self._total.add(new)
+        if self._total.overflowed:
+            self._total = CompensatedSum(self._values)
+
+    @override
+    def _result(self, /) -> float:
+        return self._total.value() / len(self._values)
+
+
+@final
+class RxRollingVar(RxWindow[float]):
+    """
+    Welford's online algorithm, extended with the removal of values.
+
+    The removals aren't numerically stable, e.g. after a large value leaves
+    the window. So every `window` replacements, the mean and the sum of
+    squared deviations are recomputed from the window (in two passes).
+    """
+
+    __slots__ = ('_count', '_ddof', '_m2', '_mean')
+
+    name: ClassVar[str] = 'rx_rolling_var'
+
+    _ddof: int
+    _mean: float
+    _m2: float
+    # the amount of replacements, modulo the window size
+    _count: int
+
+    @override
+    def __init__(self, x: Rx[Any], window: int, ddof: int = 1, /) -> None:
+        self._ddof = ddof
+        self._mean = self._m2 = 0.0
+        self._count = 0
+        super().__init__(x, window, ddof)
+
+    @override
+    def _append(self, new: Any, /) -> None:
+        delta = new - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (new - self._mean)
+
+    @override
+    def _replace(self, old: Any, new: Any, /) -> None:
+        self._count = (self._count + 1) % self.window
+        if not self._count:
+            self._resync()
+            return
+
+        mean = self._mean
+        self._mean += (new - old) / self.window
+        self._m2 += (new - old) * (new - self._mean + old - mean)
+
+    def _resync(self, /) -> None:
+        values = self._values
+        self._mean = mean = sum(values) / len(values)
+        self._m2 = sum((value - mean) ** 2 for value in values)
+
+    @override
+    def _result(self, /) -> float:
+        if (dof := len(self._values) - self._ddof) <= 0:
+            return math.nan
+        return max(self._m2, 0.0) / dof
+
+
+class RxRollingExtreme[Y](RxRolling[Y]):
+    """
+    Rolling min or max, using a monotonic queue of `(index, value)` items, so
+    that no window of values is needed.
+    """
+
+    __slots__ = ('_count', '_queue', 'window')
+
+    is_max: ClassVar[bool]
+
+    window: int
+    _count: int
+    _queue: collections.deque[tuple[int, Any]]
+
+    @override
+    def __init__(self, x: Rx[Any], window: int, /) -> None:
+        if window < 1:
+            raise ValueError('window must be >=1')
+
+        self.window = window
+        self._count = 0
+        self._queue = collections.deque()
+        super().__init__(x, window)
+
+    @override
+    def _add(self, value: Any, /) -> None:
+        queue = self._queue
+        if self.is_max:
+            while queue and queue[-1][1] <= value:
+                queue.pop()
+        else:
+            while queue and queue[-1][1] >= value:
+                queue.pop()
+
+        queue.append((self._count, value))
+        if queue[0][0] <= self._count - self.window:
+            queue.popleft()
+        self._count += 1
+
+    @override
+    def _result(self, /) -> Y:
+        return cast(Y, self._queue[0][1])
+
+
+@final
+class RxRollingMin[Y](RxRollingExtreme[Y]):
+    __slots__ = ()
+    name: ClassVar[str] = 'rx_rolling_min'
+    is_max: ClassVar[bool] = False
+
+
+@final
+class RxRollingMax[Y](RxRollingExtreme[Y]):
+    __slots__ = ()
+    name: ClassVar[str] = 'rx_rolling_max'
+    is_max: ClassVar[bool] = True
+
+
+@final
+class RxEWMA(RxRolling[float]):
+    """Exponentially weighted moving average."""
+
+    __slots__ = ('_alpha', '_mean')
+
+    name: ClassVar[str] = 'rx_ewma'
+
+    _alpha: float
+    _mean: float | None
+
+    @override
+    def __init__(self, x: Rx[Any], alpha: float, /) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError('alpha must be within (0, 1]')
+
+        self._alpha = alpha
+        self._mean = None
+        super().__init__(x, alpha)
+
+    @override
+    def _add(self, value: Any, /) -> None:
+        if self._mean is None:
+            self._mean = value
+        else:
+            self._mean += self._alpha * (value - self._mean)
+
+    @override
+    def _result(self, /) -> float:
+        assert self._mean is not None
+        return self._mean
+
+
+def rx_rolling_mean(x: Rx[Any], window: int, /) -> RxRollingMean:
+    """
+    The reactive mean of the last `window` values of `x`, updated in O(1)
+    time.
+
+    Examples:
+        >>> from rxio import rx
+        >>> x = rx(1, history=4)
+        >>> x += 1
+        >>> m = rx_rolling_mean(x, 2)
+        >>> float(m)
+        1.5
+        >>> x += 1
+        >>> float(m)
+        2.5
+
+    """
+    return RxRollingMean(x, window)
+
+
+def rx_rolling_var(x: Rx[Any], window: int, /, ddof: int = 1) -> RxRollingVar:
+    """
+    The reactive variance of the last `window` values of `x`, updated in O(1)
+    time. It's `nan` if there are not more than `ddof` values.
+    """
+    return RxRollingVar(x, window, ddof)
+
+
+def rx_rolling_min[Y](x: Rx[Y], window: int, /) -> RxRollingMin[Y]:
+    """
+    The reactive minimum of the last `window` values of `x`, updated in O(1)
+    amortized time.
+    """
+    return RxRollingMin(x, window)
+
+
+def rx_rolling_max[Y](x: Rx[Y], window: int, /) -> RxRollingMax[Y]:
+    """
+    The reactive maximum of the last `window` values of `x`, updated in O(1)
+    amortized time.
+    """
+    return RxRollingMax(x, window)
+
+
+def rx_ewma(x: Rx[Any], alpha: float, /) -> RxEWMA:
+    """
+    The reactive exponentially weighted moving average of `x`, with smoothing
+    factor `0 < alpha <= 1`, updated in O(1) time.
+    """
+    return RxEWMA(x, alpha)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+
+__all__ = ('rx_evaluate',)
+
+import contextlib
+import numbers
+from typing import TYPE_CHECKING, Any
+
+from .rx import RxMap, RxOp, RxSelect
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy.typing as npt
+
+    from .rx import Rx
+
+
+# (whether it depends on the scenarios, the value or the array of values)
+type _Result = tuple[bool, Any]
+
+# the dtype chars of float64, complex128, and object
+_EXACT_DTYPES = 'dDO'
+
+
+def _as_exact(np: Any, values: npt.ArrayLike, /) -> npt.NDArray[Any]:
+    """
+    Converts the values to an array that has the same (arithmetic) semantics
+    as the Python scalars, i.e. float64, complex128, or object.
+    """
+    array = np.asarray(values)
+    if array.dtype.char in _EXACT_DTYPES:
+        return array
+    # e.g. ints would overflow, and `True + True` would be `True`
+    return array.astype(object)
+
+
+def _infer_dtype(np: Any, out: npt.NDArray[Any], /) -> npt.NDArray[Any]:
+    """Infer the dtype of the object array, unless it contains non-scalars."""
+    if out.dtype != np.object_:
+        return out
+    try:
+        result = np.array(out.tolist())
+    except (ValueError, OverflowError):
+        return out
+    return result if result.shape == out.shape else out
+
+
+def _is_numeric(np: Any, value: Any, /) -> bool:
+    """Whether the value is a numeric scalar, or an array of them."""
+    if not isinstance(value, np.ndarray):
+        return isinstance(value, numbers.Number)
+    if value.dtype != np.object_:
+        return value.dtype.kind in 'biufc'
+    return all(isinstance(x, numbers.Number) for x in value.flat)
+
+
+def _evaluate_map(
+    np: Any,
+    node: RxMap[Any],
+    args: list[_Result],
+    shape: tuple[int, ...],
+) -> npt.NDArray[Any]:
+    func = node.__func__
+    values = [value for _, value in args]
+    # projections would select from the scenarios axis instead, and
+    # sequences (e.g. tuples) would be broadcasted, instead of e.g. repeated
+    if (
+        isinstance(node, RxOp)
+        and not isinstance(node, RxSelect)
+        and all(_is_numeric(np, value) for value in values)
+    ):
+        # the operators support (numpy) broadcasting, and the errors of
+        # floats are raised, so that the Python semantics are preserved
+        # otherwise the failure (e.g. `ZeroDivisionError`) is raised by the
+        # per-scenario calls
+        with contextlib.suppress(Exception), np.errstate(all='raise'):
+            return _as_exact(np, func(*values))
+
+    # the functions are called with the Python scalars, e.g. not `np.float64`
+    arrays = [
+        np.broadcast_to(value, shape).astype(object) if varies else None
+        for varies, value in args
+    ]
+    out = np.empty(shape, dtype=object)
+    for ix in np.ndindex(shape):
+        out[ix] = func(*(
+            value if array is None else array[ix]
+            for array, (_, value) in zip(arrays, args, strict=True)
+        ))
+
+    # keep the exact values, unless they're all floats or complex numbers
+    inferred = _infer_dtype(np, out)
+    return inferred if inferred.dtype.char in _EXACT_DTYPES else out
+
+
+def _evaluate_node(
+    np: Any,
+    node: RxMap[Any],
+    results: Mapping[int, _Result],
+    shape: tuple[int, ...],
+) -> _Result:
+    if not node.is_pure:
+        raise TypeError(f'cannot evaluate scenarios of {node!r}')
+
+    params = node.__rx_parents__()
+    args: list[_Result] = [
+        (False, base.get()) if p is None else results[id(p)]
+        for p, base in zip(params, node.__rx_bases__, strict=True)
+    ]
+    if not any(varies for varies, _ in args):
+        return False, node.__rx_get__()
+
+    try:
+        return True, _evaluate_map(np, node, args, shape)
+    except Exception as e:
+        e.add_note(repr(node))
+        raise
+
+
+def rx_evaluate(
+    node: Rx[Any],
+    scenarios: Mapping[Rx[Any], npt.ArrayLike],
+    /,
+) -> npt.NDArray[Any]:
+    """
+    Evaluates the node for each of the scenarios at once, without changing
+    the state of the graph.
+
+    The scenarios map (source or derived) nodes to arrays of alternative
+    values, which are broadcasted against each other. The operators are
+    evaluated in a vectorized way, whereas the other functions are called
+    once per scenario. Nodes that don't depend on the scenarios use their
+    current value.
+
+    The results are the same as those of the graph itself: integers don't
+    overflow, and e.g. a division by zero raises `ZeroDivisionError`. So if
+    a vectorized operator fails, it is retried per scenario.
+
+    This requires `numpy`, e.g. through the `rxio[numpy]` extra.
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as e:
+        msg = 'rx_evaluate requires numpy: pip install rxio[numpy]'
+        raise ImportError(msg) from e
+
+    inputs = {id(x): _as_exact(np, values) for x, values in scenarios.items()}
+    shape = np.broadcast_shapes(*(values.shape for values in inputs.values()))
+
+    # iterative post-order traversal of the ancestors
+    results: dict[int, _Result] = {}
+    stack: list[tuple[Rx[Any], bool]] = [(node, False)]
+    while stack:
+        x, expanded = stack.pop()
+        if (key := id(x)) in results:
+            continue
+
+        if key in inputs:
+            results[key] = True, inputs[key]
+        elif not isinstance(x, RxMap):
+            results[key] = False, x.__rx_get__()
+        elif not expanded:
+            stack.append((x, True))
+            parents = x.__rx_parents__()
+            stack.extend((p, False) for p in parents if p is not None)
+        else:
+            results[key] = _evaluate_node(np, x, results, shape)
+
+    out = np.asarray(results[id(node)][1])
+    if out.shape != shape:
+        out = np.broadcast_to(out, shape).copy()
+    return _infer_dtype(np, out)
@@ -1,8 +1,24 @@
+from __future__ import annotations
+
+import collections
 import itertools
 import time
-from typing import ClassVar, Final, Literal, NoReturn, final, override
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Final,
+    Literal,
+    NoReturn,
+    final,
+    override,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
 
-from optype import CanCall
+    from optype import CanCall
 
 
 class State[V]:
@@ -87,7 +103,7 @@ class StateSignal[V](State[V]):
 
 @final
 class StateVar[V](State[V]):
-    __slots__ = ('__clock', '_item')
+    __slots__ = ('__clock', '_history', '_item')
     __match_args__ = ('_value',)
 
     is_constant: ClassVar[bool] = False
@@ -95,10 +111,19 @@ class StateVar[V](State[V]):
 
     __clock: CanCall[[], int]
     _item: tuple[int, V]
+    # bounded ring buffer of the most recent items, including the current one
+    _history: collections.deque[tuple[int, V]] | None
+
+    def __init__(self, initial: V, /, history: int = 1) -> None:
+        if history < 1:
+            raise ValueError('history must be >=1')
 
-    def __init__(self, initial: V, /) -> None:
         self.__clock = itertools.count(0).__next__
         self._item = self.__clock(), initial
+        if history > 1:
+            self._history = collections.deque([self._item], maxlen=history)
+        else:
+            self._history = None
 
     @property
     def _value(self) -> V:
@@ -108,6 +133,26 @@ class StateVar[V](State[V]):
     def item(self) -> tuple[int, V]:
         return self._item
 
+    def history(self) -> tuple[tuple[int, V], ...]:
+        """The retained `(tick, value)` items, from old to new."""
+        if self._history is None:
+            return (self._item,)
+        return tuple(self._history)
+
+    def item_at(self, tick: int, /) -> tuple[int, V]:
+        """
+        Returns the retained item at the given tick. A `KeyError` is raised if
+        it's in the future, or if it is no longer retained.
+        """
+        history = self._history if self._history is not None else [self._item]
+        index = tick - history[0][0]
+        if not 0 <= index < len(history):
+            raise KeyError(tick)
+
+        item = history[index]
+        assert item[0] == tick
+        return item
+
     @override
     def set(self, new_value: V, /) -> tuple[int, bool]:
         tick, value = self._item
@@ -129,5 +174,54 @@ class StateVar[V](State[V]):
         new_tick = self._item[0]
         assert new_tick == tick + 1, 'race condition encountered'
 
+        if self._history is not None:
+            self._history.append(self._item)
+
         # return the new tick and True (changed)
         return new_tick, True
+
+
+@final
+class Raised:
+    """
+    A cached failure, i.e. the exception that was raised while computing the
+    value of a node. It is stored as the node state until an input changes.
+    """
+
+    __slots__ = ('exc', 'tb')
+
+    exc: Final[Exception]
+    tb: Final[TracebackType | None]
+
+    def __init__(self, exc: Exception, /) -> None:
+        self.exc = exc
+        self.tb = exc.__traceback__
+
+    @classmethod
+    def combine(
+        cls,
+        failures: Iterable[Raised],
+        message: str,
+        /,
+    ) -> Raised | None:
+        """
+        The failure of multiple inputs, i.e. the single distinct failure, or
+        an `ExceptionGroup` of them. Returns `None` if there are no failures.
+        """
+        distinct: list[Raised] = []
+        for failure in failures:
+            # bases of the same parent share their failure
+            if not any(failure.exc is other.exc for other in distinct):
+                distinct.append(failure)
+
+        if len(distinct) <= 1:
+            return distinct[0] if distinct else None
+        return cls(ExceptionGroup(message, [f.exc for f in distinct]))
+
+    def reraise(self, /) -> NoReturn:
+        # restore the original traceback, so that it doesn't grow on each read
+        raise self.exc.with_traceback(self.tb)
+
+    @override
+    def __repr__(self) -> str:
+        return f'<raised {self.exc!r}>'
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+
+__all__ = ('CompensatedSum',)
+
+import collections
+import math
+from typing import TYPE_CHECKING, Any, final
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@final
+class CompensatedSum:
+    """
+    Running sum, that values can be added to, and removed from, without
+    accumulating rounding errors.
+
+    Float sums are compensated (Neumaier), so that the rounding errors of the
+    removed values don't accumulate, e.g. when a large value is removed.
+    The non-finite values (`nan`, `inf` and `-inf`) are counted separately,
+    because e.g. `inf - inf` is `nan`, so that the finite sum is restored
+    once they're removed.
+
+    Examples:
+        >>> s = CompensatedSum([1e16, 1.0, float('inf')])
+        >>> s.value()
+        inf
+        >>> s.remove(float('inf'))
+        >>> s.remove(1e16)
+        >>> s.value()
+        1.0
+
+    """
+
+    __slots__ = ('_error', '_nonfinite', '_total')
+
+    _total: Any
+    # the (float) rounding error of the total
+    _error: float
+    # the amount of `nan`, `inf` and `-inf` values, by their `repr`
+    _nonfinite: collections.Counter[str]
+
+    def __init__(self, values: Iterable[Any] = (), /) -> None:
+        self._total, self._error = 0, 0.0
+        self._nonfinite = collections.Counter()
+        for value in values:
+            self.add(value)
+
+    @property
+    def overflowed(self, /) -> bool:
+        """Whether the finite values summed to an infinite total."""
+        return isinstance(self._total, float) and not math.isfinite(
+            self._total,
+        )
+
+    def add(self, value: Any, /) -> None:
+        if isinstance(value, float) and not math.isfinite(value):
+            self._nonfinite[repr(float(value))] += 1
+        else:
+            self._accumulate(value)
+
+    def remove(self, value: Any, /) -> None:
+        if isinstance(value, float) and not math.isfinite(value):
+            self._nonfinite[repr(float(value))] -= 1
+        else:
+            self._accumulate(-value)
+
+    def _accumulate(self, value: Any, /) -> None:
+        total = self._total + value
+        if isinstance(total, float) and math.isfinite(total):
+            if abs(self._total) >= abs(value):
+                self._error += (self._total - total) + value
+            else:
+                self._error += (value - total) + self._total
+        self._total = total
+
+    def value(self, /) -> Any:
+        if nonfinite := +self._nonfinite:
+            # e.g. `inf + -inf` is `nan`
+            return sum(map(float, nonfinite))
+        if self._error and not self.overflowed:
+            return self._total + self._error
+        return self._total
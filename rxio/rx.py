@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import concurrent.futures as cf
 import contextlib
+import functools
 import math
+import sys
+import threading
 from collections.abc import Callable
 from itertools import chain, starmap
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Concatenate,
     Final,
     Generic,
@@ -21,11 +26,13 @@ from weakref import WeakValueDictionary
 
 import optype as ot
 
-from ._state import StateConst, StateVar
+from ._cache import LRUCache
+from ._mvcc import VersionStore
+from ._state import Raised, StateConst, StateVar
 
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Hashable, Iterable
     from types import EllipsisType, NotImplementedType
 
     from ._state import State
@@ -37,20 +44,212 @@ type CanRx[X] = Rx[X] | X
 Y_co = TypeVar('Y_co', covariant=True)
 
 
+class _Scheduler(threading.local):
+    """
+    Thread-local queue of the effects that are pending, i.e. those with
+    invalidated dependencies. Effects are deduplicated, and are flushed once
+    the outermost batch exits.
+
+    The failures of effects aren't raised to the (unrelated) writer, since
+    its write already happened. Instead, they are cached by the effect, see
+    `RxEffect.exception()`.
+    """
+
+    _depth: int
+    _queue: dict[RxEffect, None]
+
+    def __init__(self, /) -> None:
+        self._depth = 0
+        self._queue = {}
+
+    def schedule(self, effect: RxEffect, /) -> None:
+        self._queue[effect] = None
+        if not self._depth:
+            self.flush()
+
+    def cancel(self, effect: RxEffect, /) -> None:
+        self._queue.pop(effect, None)
+
+    @contextlib.contextmanager
+    def batch(self, /) -> Generator[None, None, None]:
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.flush()
+
+    def flush(self, /) -> None:
+        if self._depth:
+            # already flushing, or within a batch
+            return
+
+        # effects that are scheduled while flushing are run in the same flush
+        self._depth += 1
+        try:
+            while self._queue:
+                effect = next(iter(self._queue))
+                del self._queue[effect]
+                with contextlib.suppress(Exception):
+                    effect.__rx_get__()
+        finally:
+            self._depth -= 1
+
+
+_scheduler: Final = _Scheduler()
+
+
+class _Interner(threading.local):
+    """
+    Hash-consing of derived nodes, i.e. common subexpression elimination.
+    Nodes are keyed by the method that created them, their parent identities,
+    and the other (constant) arguments. The table is shared, but it's only
+    used within the (thread-local) `interning()` context.
+    """
+
+    depth: int
+
+    table: ClassVar[WeakValueDictionary[tuple[Any, ...], RxMap[Any]]] = (
+        WeakValueDictionary()
+    )
+
+    def __init__(self, /) -> None:
+        self.depth = 0
+
+
+_interner: Final = _Interner()
+
+_cache: Final = LRUCache()
+
+
+class _Parallel(threading.local):
+    """
+    The (thread-local) executor that is used to pull independent parent
+    subgraphs concurrently, within the `parallel()` context.
+    """
+
+    executor: cf.Executor | None
+    # the independent groups of the invalidated parents of the nodes in the
+    # dirty subgraph of the current pull, or `None` if not pulling
+    groups: dict[RxMap[Any], list[list[RxMap[Any]]]] | None
+
+    def __init__(self, /) -> None:
+        self.executor = None
+        self.groups = None
+
+
+_parallel: Final = _Parallel()
+
+_versions: Final = VersionStore()
+
+
+class _Snapshots(threading.local):
+    """The (thread-local) snapshot that the reads are resolved against."""
+
+    current: Snapshot | None
+
+    def __init__(self, /) -> None:
+        self.current = None
+
+    @contextlib.contextmanager
+    def suspended(self, /) -> Generator[None, None, None]:
+        """Reads and writes the live values, e.g. to update the caches."""
+        prev, self.current = self.current, None
+        try:
+            yield
+        finally:
+            self.current = prev
+
+
+_snapshots: Final = _Snapshots()
+
+
+def _pull(nodes: Iterable[Rx[Any]], /) -> None:
+    for node in nodes:
+        # failures are cached, and are raised later on by the child
+        with contextlib.suppress(Exception):
+            node.__rx_get__()
+
+
+# the constants that are interchangeable if their type and repr are equal
+_ATOMIC_TYPES: Final = frozenset({bool, int, float, complex, str, bytes})
+
+
+def _const_key(value: object, /) -> Hashable:
+    """
+    The intern key of a constant arg. Unlike `==`, it distinguishes e.g.
+    `0.0` from `-0.0`, and `(1,)` from `(True,)`. Other constants are keyed
+    by identity, since they're kept alive by the node.
+    """
+    if type(value) in _ATOMIC_TYPES:
+        return type(value), repr(value)
+    if type(value) is tuple:
+        items = cast(tuple[object, ...], value)
+        return tuple, *map(_const_key, items)
+    return type(value), id(value)
+
+
+def _interned[**Xs, R: 'RxMap[Any]'](
+    method: Callable[Xs, R],
+    /,
+) -> Callable[Xs, R]:
+    """
+    Within an `interning()` context, the decorated method returns the
+    existing live node if it was called with the same parents and constant
+    args before, instead of creating a new one.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args: Xs.args, **kwargs: Xs.kwargs) -> R:
+        if not _interner.depth or kwargs:
+            return method(*args, **kwargs)
+
+        rx_args = [cast(Rx[Any], arg) for arg in args if isinstance(arg, Rx)]
+        parents = {id(arg): arg for arg in rx_args}
+        key = (method, *(
+            id(arg) if id(arg) in parents else _const_key(arg)
+            for arg in args
+        ))
+
+        # the ids of dead parents could have been reused
+        node = _Interner.table.get(key)
+        if node is not None and all(
+            node in parent.__rx_out__ for parent in parents.values()
+        ):
+            return cast(R, node)
+
+        _Interner.table[key] = node = method(*args, **kwargs)
+        return node
+
+    return wrapper
+
+
 class Rx(Generic[Y_co]):  # noqa: PLR0904
-    __slots__ = ('__rx_bases__', '__rx_out__', '__rx_state__', '__weakref__')
+    __slots__ = (
+        '__rx_bases__',
+        '__rx_out__',
+        '__rx_state__',
+        '__weakref__',
+        '_rx_epoch',
+    )
 
     __rx_bases__: tuple[State[Any], ...]
     __rx_state__: StateVar[EllipsisType | Y_co]
     # __rx_out__: WeakKeyDictionary[Rx[Any], int]
     __rx_out__: dict[Rx[Any], int]
+    # the amount of invalidations, including those that were no-ops
+    _rx_epoch: int
 
-    def __init__(self, value: Y_co, /) -> None:
+    def __init__(self, value: Y_co, /, history: int = 1) -> None:
         self.__rx_bases__ = ()
-        self.__rx_state__ = StateVar(value)
+        self.__rx_state__ = StateVar(value, history)
         self.__rx_out__ = {}
+        self._rx_epoch = 0
 
     def __rx_get__(self) -> Y_co:
+        if (snap := _snapshots.current) is not None:
+            return snap.get(self)
         return cast(Y_co, self.__rx_state__.get())
 
     def __rx_invalidate__(self, base_index: int, value: Any = ..., /) -> None:
@@ -60,8 +259,9 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
         """
         assert base_index >= 0
 
-        rx_base = self.__rx_bases__[base_index]
-        if not rx_base.set(value)[1] or not self.__rx_state__.set(...)[1]:
+        if not self._rx_set_base(base_index, value):
+            return
+        if not self.__rx_state__.set(...)[1]:
             # did not invalidate; no need to propagate
             return
 
@@ -69,6 +269,21 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
         for child, child_index in self.__rx_out__.items():
             child.__rx_invalidate__(child_index)
 
+    def _rx_set_base(self, base_index: int, value: Any, /) -> bool:
+        """
+        Sets the base, and returns whether it changed or was invalidated.
+        An unchanged base can still be invalidated, if its value was evicted.
+        """
+        rx_base = self.__rx_bases__[base_index]
+        old = rx_base.get()
+        if not rx_base.set(value)[1] and value is not Ellipsis:
+            return False
+        if old is not Ellipsis:
+            # a concurrent pull compares this after caching its value, since
+            # it could've been computed from the old base
+            self._rx_epoch += 1
+        return True
+
     # type conversions (non-reactive)
 
     @override
@@ -99,10 +314,10 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
 
     # TODO: format(CanFormat[Y: str]) -> RxFormat (`str & RxMap[str]`)
 
-    @override
-    def __hash__(self) -> int:
-        # TODO: custom rx_hash() function
-        return hash((type(self), self.__rx_bases__, self.__rx_state__))
+    # TODO: custom rx_hash() function
+    # identity-based, so that dict and set lookups (e.g. `__rx_out__`) are
+    # cheap
+    __hash__ = object.__hash__
 
     def __index__(self: Rx[ot.CanIndex]) -> int:
         return ot.do_index(self.__rx_get__())
@@ -113,55 +328,68 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
 
     # rich comparison ops
 
+    @_interned
     def __lt__[X, Y](self: Rx[ot.CanLt[X, Y]], other: X) -> RxOp2[Y]:
         return RxOp2(10, ' < ', ot.do_lt, self, other)
 
+    @_interned
     def __le__[X, Y](self: Rx[ot.CanLe[X, Y]], other: X) -> RxOp2[Y]:
         return RxOp2(10, ' <= ', ot.do_le, self, other)
 
     @override
+    @_interned
     def __eq__[X, Y](self: Rx[ot.CanEq[X, Y]], other: X) -> RxOp2[Y]:  # type: ignore[override]
         return RxOp2(10, ' == ', ot.do_eq, self, other)
 
     @override
+    @_interned
     def __ne__[X, Y](self: Rx[ot.CanNe[X, Y]], other: X) -> RxOp2[Y]:  # type: ignore[override]
         return RxOp2(10, ' != ', ot.do_ne, self, other)
 
+    @_interned
     def __gt__[X, Y](self: Rx[ot.CanGt[X, Y]], other: X) -> RxOp2[Y]:
         return RxOp2(10, ' > ', ot.do_gt, self, other)
 
+    @_interned
     def __ge__[X, Y](self: Rx[ot.CanGe[X, Y]], other: X) -> RxOp2[Y]:
         return RxOp2(10, ' >= ', ot.do_ge, self, other)
 
     # binary arithmetic ops
 
+    @_interned
     def __add__[X, Y](self: Rx[ot.CanAdd[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(60, ' + ', ot.do_add, self, x)
 
+    @_interned
     def __sub__[X, Y](self: Rx[ot.CanSub[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(60, ' - ', ot.do_sub, self, x)
 
+    @_interned
     def __mul__[X, Y](self: Rx[ot.CanMul[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(70, ' * ', ot.do_mul, self, x)
 
+    @_interned
     def __matmul__[X, Y](
         self: Rx[ot.CanMatmul[X, Y]],
         x: CanRx[X],
     ) -> RxOp2[Y]:
         return RxOp2(70, ' @ ', ot.do_matmul, self, x)
 
+    @_interned
     def __truediv__[X, Y](
         self: Rx[ot.CanTruediv[X, Y]],
         x: CanRx[X],
     ) -> RxOp2[Y]:
         return RxOp2(70, ' / ', ot.do_truediv, self, x)
 
+    @_interned
     def __floordiv__[X, Y](
         self: Rx[ot.CanFloordiv[X, Y]],
         x: CanRx[X],
     ) -> RxOp2[Y]:
         return RxOp2(70, ' // ', ot.do_floordiv, self, x)
 
+    @_interned
     def __mod__[X, Y](self: Rx[ot.CanMod[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(70, ' % ', ot.do_mod, self, x)
 
@@ -176,6 +404,7 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
         m: CanRx[M],
     ) -> RxMap[Y]: ...
 
+    @_interned
     def __pow__(
         self,
         x: CanRx[Any],
@@ -185,79 +414,101 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
             return RxMap(pow, self, x, m)
         return RxOp2(90, '**', pow, self, x)
 
+    @_interned
     def __lshift__[X, Y](
         self: Rx[ot.CanLshift[X, Y]],
         x: CanRx[X],
     ) -> RxOp2[Y]:
         return RxOp2(50, ' << ', ot.do_lshift, self, x)
 
+    @_interned
     def __rshift__[X, Y](
         self: Rx[ot.CanRshift[X, Y]],
         x: CanRx[X],
     ) -> RxOp2[Y]:
         return RxOp2(50, ' >> ', ot.do_rshift, self, x)
 
+    @_interned
     def __and__[X, Y](self: Rx[ot.CanAnd[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(40, ' & ', ot.do_and, self, x)
 
+    @_interned
     def __xor__[X, Y](self: Rx[ot.CanXor[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(30, ' ^ ', ot.do_xor, self, x)
 
+    @_interned
     def __or__[X, Y](self: Rx[ot.CanOr[X, Y]], x: CanRx[X]) -> RxOp2[Y]:
         return RxOp2(20, ' | ', ot.do_or, self, x)
 
     # reflected arithmetic ops
 
+    @_interned
     def __radd__[X, Y](self: Rx[ot.CanRAdd[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(60, ' + ', ot.do_radd, self, x)
 
+    @_interned
     def __rsub__[X, Y](self: Rx[ot.CanRSub[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(60, ' - ', ot.do_rsub, self, x)
 
+    @_interned
     def __rmul__[X, Y](self: Rx[ot.CanRMul[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(70, ' * ', ot.do_rmul, self, x)
 
+    @_interned
     def __rmatmul__[X, Y](self: Rx[ot.CanRMatmul[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(70, ' @ ', ot.do_rmatmul, self, x)
 
+    @_interned
     def __rtruediv__[X, Y](self: Rx[ot.CanRTruediv[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(70, ' / ', ot.do_rtruediv, self, x)
 
+    @_interned
     def __rfloordiv__[X, Y](self: Rx[ot.CanRFloordiv[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(70, ' // ', ot.do_rfloordiv, self, x)
 
+    @_interned
     def __rmod__[X, Y](self: Rx[ot.CanRMod[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(70, ' % ', ot.do_rmod, self, x)
 
+    @_interned
     def __rpow__[X, Y](self: Rx[ot.CanRPow[X, Y]], x: X, /) -> RxOp2[Y]:
         return RxOp2(90, '**', ot.do_rpow, self, x)
 
+    @_interned
     def __rlshift__[X, Y](self: Rx[ot.CanRLshift[X, Y]], x: X, /) -> RxOp2[Y]:
         return RxOp2(50, ' << ', ot.do_rlshift, self, x)
 
+    @_interned
     def __rrshift__[X, Y](self: Rx[ot.CanRRshift[X, Y]], x: X, /) -> RxOp2[Y]:
         return RxOp2(50, ' >> ', ot.do_rrshift, self, x)
 
+    @_interned
     def __rand__[X, Y](self: Rx[ot.CanRAnd[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(40, ' & ', ot.do_rand, self, x)
 
+    @_interned
     def __rxor__[X, Y](self: Rx[ot.CanRXor[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(30, ' ^ ', ot.do_rxor, self, x)
 
+    @_interned
     def __ror__[X, Y](self: Rx[ot.CanROr[X, Y]], x: X) -> RxOp2[Y]:
         return RxOp2(20, ' | ', ot.do_ror, self, x)
 
     # arithmetic operators (unary)
 
+    @_interned
     def __neg__[Y](self: Rx[ot.CanNeg[Y]]) -> RxOp1[Y]:
         return RxOp1(80, '-', ot.do_neg, self)
 
+    @_interned
     def __pos__[Y](self: Rx[ot.CanPos[Y]]) -> RxOp1[Y]:
         return RxOp1(80, '+', ot.do_pos, self)
 
+    @_interned
     def __invert__[Y](self: Rx[ot.CanInvert[Y]]) -> RxOp1[Y]:
         return RxOp1(80, '~', ot.do_invert, self)
 
+    @_interned
     def __abs__[Y](self: Rx[ot.CanAbs[Y]]) -> RxMap[Y]:
         return RxMap(cast(Callable[[ot.CanAbs[Y]], Y], abs), self)
 
@@ -271,6 +522,7 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
     def __round__[N, Y](self: Rx[ot.CanRound2[N, Y]], n: CanRx[N]) -> RxMap[Y]:
         ...
 
+    @_interned
     def __round__[N, Y1, Y2](
         self: Rx[ot.CanRound1[Y1] | ot.CanRound2[N, Y2]],
         n: CanRx[N] | None = None,
@@ -282,17 +534,74 @@ class Rx(Generic[Y_co]):  # noqa: PLR0904
         round2 = cast(Callable[[ot.CanRound2[N, Y2], N], Y2], round)
         return RxMap(round2, self, n)
 
+    @_interned
     def __trunc__[Y](self: Rx[ot.CanTrunc[Y]]) -> RxMap[Y]:
         return RxMap(cast(Callable[[ot.CanTrunc[Y]], Y], math.trunc), self)
 
+    @_interned
     def __floor__[Y](self: Rx[ot.CanFloor[Y]]) -> RxMap[Y]:
         return RxMap(cast(Callable[[ot.CanFloor[Y]], Y], math.floor), self)
 
+    @_interned
     def __ceil__[Y](self: Rx[ot.CanCeil[Y]]) -> RxMap[Y]:
         return RxMap(cast(Callable[[ot.CanCeil[Y]], Y], math.ceil), self)
 
+    # projections
+
+    def __getattr__(self, name: str, /) -> RxGetAttr[Any]:
+        """
+        Reactive attribute access, e.g. of a (frozen) dataclass or namedtuple.
+        Private and dunder attributes are not projected, and neither are those
+        that the current value doesn't have (so e.g. `hasattr` works). This
+        uses the cached value, so only an invalidated node is evaluated.
+
+        Note that a projection remains subscribed to this node for as long as
+        this node is alive. So the projections are interned, i.e. accessing
+        the same attribute again returns the existing projection.
+        """
+        cls = type(self).__name__
+        msg = f'{cls!r} object has no attribute {name!r}'
+        if name.startswith('_'):
+            raise AttributeError(msg)
+
+        if (value := self.__rx_state__.get()) is Ellipsis:
+            with contextlib.suppress(Exception):
+                value = self.__rx_get__()
+        # a failure is raised once the projection is read
+        if (
+            value is not Ellipsis
+            and not isinstance(value, Raised)
+            and not hasattr(value, name)
+        ):
+            raise AttributeError(msg)
+
+        with interning():
+            return self._rx_getattr(name)
+
+    @_interned
+    def _rx_getattr(self, name: str, /) -> RxGetAttr[Any]:
+        return RxGetAttr(self, name)
+
+    def __getitem__[K, V](
+        self: Rx[ot.CanGetitem[K, V]],
+        key: CanRx[K],
+        /,
+    ) -> RxGetItem[V]:
+        # interned, like the attribute projections
+        with interning():
+            return self._rx_getitem(key)
+
+    @_interned
+    def _rx_getitem[K, V](
+        self: Rx[ot.CanGetitem[K, V]],
+        key: CanRx[K],
+        /,
+    ) -> RxGetItem[V]:
+        return RxGetItem(self, key)
+
     # callable emulation
 
+    @_interned
     def __call__[**Xs, Y](
         self: Rx[Callable[Xs, Y]],
         *args: CanRx[Any],
@@ -330,17 +639,30 @@ class RxVar[X, Y](Rx[Y]):
         """
         assert value is not Ellipsis
 
-        with self.__rx_atomic__():
-            _, changed = self.__rx_state__.set(cast(Y, value))
+        with (
+            self.__rx_atomic__(),
+            _scheduler.batch(),
+            self._rx_write(cast(Y, value)) as changed,
+        ):
             if not changed:
                 return False
 
-            # propagate to children
+            # propagate to children; the invalidated effects run afterwards
             for child, base_index in self.__rx_out__.items():
                 child.__rx_invalidate__(base_index, value)
 
         return True
 
+    def _rx_write(
+        self,
+        value: Y,
+        /,
+    ) -> contextlib.AbstractContextManager[bool]:
+        if self.__rx_bases__:
+            # derived values aren't versioned, but recomputed by snapshots
+            return contextlib.nullcontext(self.__rx_state__.set(value)[1])
+        return _versions.write(self, value)
+
     def __rx_update__[**Xs](
         self,
         func: Callable[Concatenate[Y, Xs], X],
@@ -352,7 +674,8 @@ class RxVar[X, Y](Rx[Y]):
             msg = 'cannot in-place update an rx variable with rx args'
             raise TypeError(msg)
 
-        with self.__rx_atomic__():
+        # read-modify-write of the live value, also within a snapshot
+        with self.__rx_atomic__(), _snapshots.suspended():
             value = self.__rx_get__()
             value_new = func(value, *args, **kwargs)
 
@@ -413,10 +736,16 @@ class RxVar[X, Y](Rx[Y]):
 
 
 class RxMap[Y](RxVar[Y, Y]):
-    __slots__ = ('__func__', '_rx_parents')
+    __slots__ = ('__func__', '_evicted', '_rx_parents')
+
+    # whether the function can be (re)applied to other values, e.g. those of
+    # a snapshot, without side effects
+    is_pure: ClassVar[bool] = True
 
     __func__: Callable[..., Y]
     _rx_parents: WeakValueDictionary[int, Rx[Any]]
+    # whether the cached value was dropped, even though it's still valid
+    _evicted: bool
 
     @override
     def __init__(
@@ -428,46 +757,161 @@ class RxMap[Y](RxVar[Y, Y]):
         # TODO: constant if all args are constant
 
         self.__func__ = func
-
-        self._rx_parents = WeakValueDictionary()
-        rx_parent_ix: dict[int, int] = {}
-        rx_bases: list[State[Any]] = []
-        for i, arg in enumerate(rx_args):
-            if isinstance(arg, Rx):
-                if id(arg) in rx_parent_ix:
-                    # share the arg state of the same parent
-                    base_state = rx_bases[rx_parent_ix[id(arg)]]
+        self._evicted = False
+        self._rx_epoch = 0
+
+        # the live values are used, also if created within a snapshot
+        with _snapshots.suspended():
+            self._rx_parents = WeakValueDictionary()
+            rx_parent_ix: dict[int, int] = {}
+            rx_bases: list[State[Any]] = []
+            for i, arg in enumerate(rx_args):
+                if isinstance(arg, Rx):
+                    if id(arg) in rx_parent_ix:
+                        # share the arg state of the same parent
+                        base_state = rx_bases[rx_parent_ix[id(arg)]]
+                    else:
+                        rx_parent_ix[id(arg)] = i
+                        base_state = StateVar(arg.__rx_get__())
+                        # make sure we can find the parent
+                        self._rx_parents[i] = arg
                 else:
-                    rx_parent_ix[id(arg)] = i
-                    base_state = StateVar(arg.__rx_get__())
-                    # make sure we can find the parent
-                    self._rx_parents[i] = arg
-            else:
-                base_state = StateConst(arg)
+                    base_state = StateConst(arg)
 
-            rx_bases.append(base_state)
+                rx_bases.append(base_state)
 
-        self.__rx_bases__ = tuple(rx_bases)
-        self.__rx_state__ = StateVar(func(*self._get_args()))
+            self.__rx_bases__ = tuple(rx_bases)
+            self.__rx_state__ = StateVar(self._rx_start(self._get_args()))
         self.__rx_out__ = {}
 
         # make sure that our parents know about us
         for i, parent in self._rx_parents.items():
             parent.__rx_out__[self] = i
 
+        self._rx_track(self.__rx_state__.get())
+
+    def _rx_start(self, args: list[Any], /) -> Y:
+        """Computes the initial value, given the initial values of the args."""
+        return self.__func__(*args)
+
     def _get_args(self, /) -> list[Any]:
-        # TODO: exception groups + exception notes
+        """
+        Returns the (cached) values of the bases, pulling the invalidated ones.
+
+        If one of the parents failed, its exception is raised. Failures of
+        multiple parents are raised together as an `ExceptionGroup`.
+        """
+        if (executor := _parallel.executor) is None:
+            return self._collect_args()
+
+        # the dirty subgraph is grouped once, for all the nodes that are
+        # pulled (on this thread) within this pull
+        outermost = (groups := _parallel.groups) is None
+        if groups is None:
+            groups = _parallel.groups = self._group_dirty()
+        try:
+            if own_groups := groups.get(self):
+                cf.wait([
+                    executor.submit(_pull, nodes) for nodes in own_groups
+                ])
+            return self._collect_args()
+        finally:
+            if outermost:
+                _parallel.groups = None
+
+    def _collect_args(self, /) -> list[Any]:
         args: list[Any] = []
+        failures: list[Raised] = []
         for i, base_state in enumerate(self.__rx_bases__):
             value = base_state.get()
             if value is Ellipsis:
-                value = self._rx_parents[i].__rx_get__()
-                assert not base_state.set(value)[1]
+                try:
+                    value = self._rx_parents[i].__rx_get__()
+                except Exception:  # noqa: BLE001
+                    # the parent has pushed its failure to us
+                    value = base_state.get()
+                    assert isinstance(value, Raised)
+                else:
+                    assert not base_state.set(value)[1]
 
-            args.append(value)
+            if isinstance(value, Raised):
+                failures.append(value)
+            else:
+                args.append(value)
 
+        if (failed := Raised.combine(failures, repr(self))) is not None:
+            failed.reraise()
         return args
 
+    def _get_dirty_parents(self, /) -> list[RxMap[Any]]:
+        """The invalidated parents that are derived, i.e. need computing."""
+        parents = self._rx_parents
+        return [
+            parent
+            for i, base_state in enumerate(self.__rx_bases__)
+            if base_state.get() is Ellipsis
+            and isinstance(parent := parents.get(i), RxMap)
+        ]
+
+    def _group_dirty(self, /) -> dict[RxMap[Any], list[list[RxMap[Any]]]]:
+        """
+        Groups the invalidated parents of each node in the dirty subgraph by
+        their disjoint (i.e. independent) subgraphs of invalidated ancestors,
+        for the nodes that have multiple groups. Nodes that are shared between
+        subgraphs end up in the same group, so that each node is computed at
+        most once.
+
+        The ancestors are tracked as bitsets, so that the whole subgraph is
+        grouped in a single (post-order) traversal.
+        """
+        ancestors: dict[RxMap[Any], int] = {}
+        groups: dict[RxMap[Any], list[list[RxMap[Any]]]] = {}
+
+        stack: list[tuple[RxMap[Any], list[RxMap[Any]] | None]] = [
+            (self, None),
+        ]
+        while stack:
+            node, parents = stack.pop()
+            if node in ancestors:
+                continue
+            if parents is None:
+                parents = node._get_dirty_parents()  # noqa: SLF001
+                stack.append((node, parents))
+                stack.extend((p, None) for p in parents if p not in ancestors)
+                continue
+
+            # (ancestors, parents) of each group, merged once they overlap
+            merged: list[tuple[int, list[RxMap[Any]]]] = []
+            for parent in parents:
+                bits, nodes = ancestors[parent], [parent]
+                disjoint: list[tuple[int, list[RxMap[Any]]]] = []
+                for group in merged:
+                    if group[0] & bits:
+                        bits |= group[0]
+                        nodes[:0] = group[1]
+                    else:
+                        disjoint.append(group)
+                merged = [*disjoint, (bits, nodes)]
+
+            bits = 1 << len(ancestors)
+            for group_bits, _ in merged:
+                bits |= group_bits
+            ancestors[node] = bits
+            if len(merged) > 1:
+                groups[node] = [nodes for _, nodes in merged]
+
+        return groups
+
+    def __rx_parents__(self, /) -> list[Rx[Any] | None]:
+        """The parent node of each base, or `None` if it's a constant."""
+        first: dict[int, int] = {}
+        parents: list[Rx[Any] | None] = []
+        for i, base in enumerate(self.__rx_bases__):
+            # bases of the same parent share their state
+            j = first.setdefault(id(base), i)
+            parents.append(self._rx_parents.get(j))
+        return parents
+
     def _get_params(self, /) -> starmap[Rx[Any] | Any]:
         parents = self._rx_parents
         return starmap(parents.get, enumerate(self.__rx_bases__))
@@ -479,21 +923,99 @@ class RxMap[Y](RxVar[Y, Y]):
 
     @override
     def __rx_get__(self, /) -> Y:
-        """Maximally lazy evaluation."""
+        """
+        Maximally lazy evaluation.
+
+        A raised exception is cached as well, and re-raised on each read until
+        one of the inputs changes.
+        """
+        if (snap := _snapshots.current) is not None:
+            return snap.get(self)
+
         if (res := self.__rx_state__.get()) is not Ellipsis:
-            assert not any(b.get() is Ellipsis for b in self.__rx_bases__)
+            if isinstance(res, Raised):
+                res.reraise()
+            if _cache.budget is not None:
+                _cache.touch(self)
             return cast(Y, res)
 
+        epoch = self._rx_epoch
+        try:
+            res = self._rx_compute()
+        except Exception as e:
+            self._rx_store(cast(Y, Raised(e)), epoch)
+            raise
+
+        self._rx_store(res, epoch)
+        return res
+
+    def _rx_compute(self, /) -> Y:
+        """Computes the value of the invalidated node, pulling its inputs."""
         args = self._get_args()
         try:
-            res = self.__func__(*args)
+            return self.__func__(*args)
         except Exception as e:
             e.add_note(repr(self))
             raise
 
-        super().__rx_set__(res)
+    def _rx_store(self, value: Y, epoch: int, /) -> None:
+        """
+        Caches the computed value (or failure), and pushes it to the children.
+        All derived values should be set through here (or `_rx_track`).
 
-        return res
+        The `epoch` is the one from before the inputs were read. If an input
+        was invalidated since (by a concurrent write), that invalidation was
+        a no-op, so the value is invalidated (again) afterwards.
+        """
+        if self._evicted and not isinstance(value, Raised):
+            # the inputs didn't change, so the children remain valid
+            self._evicted = False
+            self.__rx_state__.set(value)
+            for child, base_index in self.__rx_out__.items():
+                child.__rx_bases__[base_index].set(value)
+        else:
+            self._evicted = False
+            super().__rx_set__(value)
+
+        if self._rx_epoch == epoch:
+            self._rx_track(value)
+        elif self.__rx_state__.set(...)[1]:
+            for child, base_index in self.__rx_out__.items():
+                child.__rx_invalidate__(base_index)
+
+    def _rx_track(self, value: object, /) -> None:
+        """Registers the cached value, so that it can be evicted."""
+        if _cache.budget is not None and not isinstance(value, Raised):
+            _cache.add(self, value)
+
+    @override
+    def __rx_invalidate__(self, base_index: int, value: Any = ..., /) -> None:
+        if not self._evicted:
+            super().__rx_invalidate__(base_index, value)
+        elif self._rx_set_base(base_index, value):
+            # no longer evicted, but invalidated
+            self._evicted = False
+            for child, child_index in self.__rx_out__.items():
+                child.__rx_invalidate__(child_index)
+
+        if _cache.budget is not None and self.__rx_state__.get() is Ellipsis:
+            _cache.discard(self)
+
+    def __rx_evict__(self, /) -> bool:
+        """
+        Drops the cached value, and the copies of it that the children hold,
+        so that it is recomputed on demand. Returns whether it was evicted.
+        This assumes that the function is deterministic.
+        """
+        state = self.__rx_state__.get()
+        if state is Ellipsis or isinstance(state, Raised):
+            return False
+
+        self.__rx_state__.set(...)
+        self._evicted = True
+        for child, base_index in self.__rx_out__.items():
+            child.__rx_bases__[base_index].set(...)
+        return True
 
     @override
     def __rx_set__(self, value: Y, /) -> bool:
@@ -578,7 +1100,385 @@ class RxOp2[Y](RxOp[Y]):
         return f'{s0}{self._symbol}{s1}'
 
 
-def rx[Y: object](obj: Y) -> RxVar[Y, Y]:
+class RxSelect[Y](RxOp[Y]):
+    """
+    Projection of a field of its (record-valued) parent.
+
+    When the parent pushes a new value, the field is projected right away.
+    If it's unchanged, the propagation is cut off, so that the dependents of
+    this field aren't invalidated by changes of other fields.
+    """
+
+    __slots__ = ()
+
+    @override
+    def __rx_invalidate__(self, base_index: int, value: Any = ..., /) -> None:
+        state = self.__rx_state__.get()
+        if (
+            value is Ellipsis
+            or state is Ellipsis
+            or isinstance(value, Raised)
+            or isinstance(state, Raised)
+        ):
+            super().__rx_invalidate__(base_index, value)
+            return
+
+        base = self.__rx_bases__[base_index]
+        args = [value if b is base else b.get() for b in self.__rx_bases__]
+
+        new, comparable, unchanged = None, False, False
+        if not any(arg is Ellipsis for arg in args):
+            try:
+                new = self.__func__(*args)
+                # the state type is invariant
+                comparable = type(new) is type(state)
+                unchanged = comparable and bool(new == state)
+            except Exception:  # noqa: BLE001
+                # it'll be raised (and cached) once pulled
+                comparable = False
+
+        if not comparable:
+            super().__rx_invalidate__(base_index, value)
+            return
+
+        base.set(value)
+        if not unchanged:
+            # push the new value, so that projections of it can cut off, too
+            self._rx_store(cast(Y, new), self._rx_epoch)
+
+
+@final
+class RxGetAttr[Y](RxSelect[Y]):
+    """Reactive attribute access, `x.name`."""
+
+    __slots__ = ('_name',)
+    _name: Final[str]
+
+    @override
+    def __init__(self, x: Rx[Any], name: str, /) -> None:
+        self._name = name
+        getattr_ = cast(Callable[[object, str], Y], ot.do_getattr)
+        super().__init__(100, getattr_, x, name)
+
+    @override
+    def __repr__(self) -> str:
+        s, _ = self._format_params()
+        return f'{s}.{self._name}'
+
+
+@final
+class RxGetItem[Y](RxSelect[Y]):
+    """Reactive subscription, `x[key]`."""
+
+    __slots__ = ()
+
+    @override
+    def __init__[K](
+        self,
+        x: Rx[ot.CanGetitem[K, Y]],
+        key: CanRx[K],
+        /,
+    ) -> None:
+        getitem = cast(Callable[[ot.CanGetitem[K, Y], K], Y], ot.do_getitem)
+        super().__init__(100, getitem, x, key)
+
+    @override
+    def __repr__(self) -> str:
+        s, key = self._format_params()
+        return f'{s}[{key}]'
+
+
+@final
+class RxEffect(RxMap[object]):
+    """
+    Runs a side effect whenever one of its dependencies changes.
+
+    The effect runs once on creation. After that, it is queued when its
+    dependencies are invalidated, and is run (at most once) after the
+    outermost `__rx_set__` or `batch()` exits. Only the nodes that the
+    effect depends on are pulled.
+
+    If it fails, the exception isn't raised to the writer, but is cached
+    until the next run, see `exception()`.
+    """
+
+    __slots__ = ()
+
+    is_pure: ClassVar[bool] = False
+
+    @override
+    def __rx_invalidate__(self, base_index: int, value: Any = ..., /) -> None:
+        clean = self.__rx_state__.get() is not Ellipsis
+        super().__rx_invalidate__(base_index, value)
+        if clean and self.__rx_state__.get() is Ellipsis:
+            _scheduler.schedule(self)
+
+    @override
+    def _rx_track(self, value: object, /) -> None:
+        # never evicted, see `__rx_evict__`
+        return
+
+    @override
+    def __rx_evict__(self, /) -> bool:
+        # an evicted effect wouldn't be scheduled when invalidated
+        return False
+
+    def exception(self, /) -> Exception | None:
+        """The exception that the last run raised, or `None` if it didn't."""
+        state = self.__rx_state__.get()
+        return state.exc if isinstance(state, Raised) else None
+
+    def dispose(self, /) -> None:
+        """Unsubscribe from the dependencies, and cancel if pending."""
+        for parent in self._rx_parents.values():
+            parent.__rx_out__.pop(self, None)
+        self._rx_parents.clear()
+        _scheduler.cancel(self)
+
+
+@final
+class Snapshot:
+    """
+    A consistent view of the graph, as of the version at which it was opened.
+
+    As long as nothing has been written since, the live (cached) values are
+    read. Otherwise, the source values are read from the retained versions,
+    and the derived nodes reuse their live value if it was computed from the
+    same values. Only the nodes with different inputs are recomputed (at
+    most once per snapshot), without touching the live caches.
+
+    Nodes with side effects, e.g. effects and rolling windows, can't be
+    recomputed, so their live value is used instead.
+    """
+
+    __slots__ = ('_memo', 'version')
+
+    version: Final[int]
+    # id -> (node, value); the node is kept alive, so that its id is unique
+    _memo: dict[int, tuple[Rx[Any], Any]]
+
+    def __init__(self, version: int, /) -> None:
+        self.version = version
+        self._memo = {}
+
+    def get[Y](self, node: Rx[Y], /) -> Y:
+        """The value of the node as of this snapshot."""
+        if isinstance(res := self._get(node), Raised):
+            res.reraise()
+        return cast(Y, res)
+
+    def _get(self, node: Rx[Any], /) -> Any:
+        """The value or `Raised` failure of the node."""
+        if isinstance(node, RxMap) and not node.is_pure:
+            return self._get_live(node)
+
+        if (key := id(node)) in self._memo:
+            return self._memo[key][1]
+
+        res: Any = ...
+        if _versions.version == self.version:
+            res = self._get_live(node)
+            # otherwise the live value could be newer than the snapshot
+            if _versions.version != self.version:
+                res = ...
+        if res is Ellipsis:
+            res = self._compute(node)
+
+        self._memo[key] = node, res
+        return res
+
+    @staticmethod
+    def _get_live(node: Rx[Any], /) -> Any:
+        with _snapshots.suspended(), contextlib.suppress(Exception):
+            return node.__rx_get__()
+        # the cached failure, or `...` if it was invalidated in the meantime
+        return node.__rx_state__.get()
+
+    def _compute(self, node: Rx[Any], /) -> Any:
+        if not isinstance(node, RxMap):
+            return _versions.read(node, self.version)
+
+        # the live state is read before the bases, which are set first
+        state = node.__rx_state__.get()
+        bases = node.__rx_bases__
+        parents = node.__rx_parents__()
+        values = [
+            base.get() if parent is None else self._get(parent)
+            for parent, base in zip(parents, bases, strict=True)
+        ]
+        if state is not Ellipsis and all(
+            value is base.get()
+            for value, base in zip(values, bases, strict=True)
+        ):
+            return state
+
+        failures = [value for value in values if isinstance(value, Raised)]
+        if (failed := Raised.combine(failures, repr(node))) is not None:
+            return failed
+
+        try:
+            return node.__func__(*values)
+        except Exception as e:  # noqa: BLE001
+            e.add_note(repr(node))
+            return Raised(e)
+
+
+def effect(func: Callable[..., object], /, *args: Rx[Any] | Any) -> RxEffect:
+    """
+    Calls `func` with the values of `args`, now and each time that one of
+    them changes. Returns the `RxEffect`, which can be disposed of.
+
+    Examples:
+        >>> a, b = rx(1), rx(2)
+        >>> e = effect(print, a, b)
+        1 2
+        >>> a += 1
+        2 2
+        >>> with batch():
+        ...     a += 1
+        ...     b += 1
+        3 3
+        >>> e.dispose()
+        >>> a += 1
+
+    """
+    return RxEffect(func, *args)
+
+
+@contextlib.contextmanager
+def interning() -> Generator[None, None, None]:
+    """
+    Within this context, the reactive operators return the existing live node
+    if a structurally identical one exists, instead of creating a new one.
+
+    Examples:
+        >>> a, b = rx(2), rx(3)
+        >>> with interning():
+        ...     c0, c1 = a * b, a * b
+        >>> c0 is c1
+        True
+        >>> a * b is c0
+        False
+
+    """
+    _interner.depth += 1
+    try:
+        yield
+    finally:
+        _interner.depth -= 1
+
+
+@contextlib.contextmanager
+def parallel(
+    executor: cf.Executor | None = None,
+    /,
+) -> Generator[cf.Executor, None, None]:
+    """
+    Within this context, the invalidated parents of a node are pulled
+    concurrently, if they belong to independent subgraphs.
+
+    If no executor is given, a `ThreadPoolExecutor` is used, which is shut
+    down on exit. This is mostly useful for expensive functions that release
+    the GIL (e.g. I/O), or on free-threaded Python builds. Since each
+    node is computed at most once, the results are deterministic.
+    """
+    prev = _parallel.executor
+    with contextlib.ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(cf.ThreadPoolExecutor())
+
+        _parallel.executor = executor
+        try:
+            yield executor
+        finally:
+            _parallel.executor = prev
+
+
+@contextlib.contextmanager
+def snapshot() -> Generator[Snapshot, None, None]:
+    """
+    Within this context, all reads see the values as of the moment that the
+    snapshot was opened, i.e. multiple nodes can be read consistently while
+    other threads continue writing. Writers are never blocked by snapshots.
+
+    The old values of the sources are retained while a snapshot needs them.
+    Writes within the snapshot update the live values.
+
+    Examples:
+        >>> a = rx(1)
+        >>> b = a * 10
+        >>> with snapshot():
+        ...     a += 1
+        ...     int(a), int(b)
+        (1, 10)
+        >>> int(a), int(b)
+        (2, 20)
+
+    """
+    version = _versions.open()
+    prev = _snapshots.current
+    _snapshots.current = snap = Snapshot(version)
+    try:
+        yield snap
+    finally:
+        _snapshots.current = prev
+        _versions.close(version)
+
+
+def memory_budget(
+    max_bytes: int | None,
+    /,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+) -> None:
+    """
+    Limits the (estimated) memory of the cached values of derived nodes to
+    `max_bytes`, or removes the limit if `None`. Once exceeded, the least
+    recently used values are evicted, and recomputed on demand.
+
+    The size of each cached value is estimated with `sizeof`, which defaults
+    to `sys.getsizeof` (i.e. the items of containers are not included).
+    Frequently used nodes can be exempted from eviction with `pin()`.
+    """
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError('max_bytes must be >=0')
+
+    _cache.sizeof = sizeof
+    _cache.resize(max_bytes)
+
+
+def pin[R: RxMap[Any]](node: R, /) -> R:
+    """Exempts the cached value of the node from eviction."""
+    _cache.pin(node)
+    return node
+
+
+def unpin(node: RxMap[Any], /) -> None:
+    """Allows the cached value of the node to be evicted again."""
+    _cache.unpin(node)
+
+
+def batch() -> contextlib.AbstractContextManager[None]:
+    """
+    Defers running the effects until the (outermost) batch exits, so that
+    each effect runs at most once, regardless of the amount of changes.
+    """
+    return _scheduler.batch()
+
+
+def rx[Y: object](obj: Y, *, history: int = 1) -> RxVar[Y, Y]:
+    """
+    Creates a reactive variable. The `history` amount of most recent
+    `(tick, value)` items are retained in a ring buffer, which is accessible
+    through `__rx_state__.history()`.
+
+    Examples:
+        >>> x = rx(1, history=3)
+        >>> for _ in range(3):
+        ...     x += 1
+        >>> x.__rx_state__.history()
+        ((1, 2), (2, 3), (3, 4))
+
+    """
     if obj is None or obj is NotImplemented:
         raise ValueError(f'`{obj}` is ')
     if obj is Ellipsis:
@@ -591,4 +1491,4 @@ def rx[Y: object](obj: Y) -> RxVar[Y, Y]:
     except TypeError as e:
         raise TypeError('mutable types are not supported (yet)') from e
 
-    return RxVar(obj)
+    return RxVar(obj, history)
@@ -0,0 +1,115 @@
+import math
+import statistics
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from rxio import rx, rx_count, rx_max, rx_mean, rx_min, rx_sum
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rxio.rx import Rx
+
+
+def _count(values: list[int]) -> int:
+    return sum(map(bool, values))
+
+
+@given(
+    st.lists(st.integers(-100, 100), min_size=1, max_size=20),
+    st.lists(st.tuples(st.integers(0, 19), st.integers(-100, 100))),
+)
+def test_aggregates(initial: list[int], updates: list[tuple[int, int]]):
+    xs = [rx(x) for x in initial]
+    # include a derived input, and a duplicate one
+    ys = [*xs, xs[0] * 2, xs[-1]]
+    aggregates: dict[Callable[[list[int]], float], Rx[Any]] = {
+        sum: rx_sum(*ys),
+        min: rx_min(*ys),
+        max: rx_max(*ys),
+        statistics.fmean: rx_mean(*ys),
+        _count: rx_count(*ys),
+    }
+
+    for i, value in updates:
+        xs[i % len(xs)].__rx_set__(value)
+        values = [y.__rx_get__() for y in ys]
+        for func, aggregate in aggregates.items():
+            assert aggregate.__rx_get__() == pytest.approx(func(values))
+
+
+def test_aggregate_exception():
+    a, b = rx(1), rx(2)
+    total = rx_sum(1 / a, 1 / b, a)
+
+    a.__rx_set__(0)
+    with pytest.raises(ZeroDivisionError):
+        float(total)
+
+    a.__rx_set__(4)
+    assert float(total) == 1 / 4 + 1 / 2 + 4
+
+
+def test_aggregate_float_error():
+    a, b = rx(1e16), rx(1.0)
+    total, mean = rx_sum(a, b), rx_mean(a, b)
+
+    a.__rx_set__(0.0)
+    assert float(total) == float(b)
+    assert float(mean) == float(b) / 2
+
+    # the rounding errors don't accumulate over many replacements
+    xs = [rx(0.1) for _ in range(10)]
+    total = rx_sum(*xs)
+    for i in range(1000):
+        xs[i % len(xs)].__rx_set__(1e16 / (i + 1) if i % 3 else 0.1)
+    for x in xs:
+        x.__rx_set__(0.1)
+    assert float(total) == pytest.approx(math.fsum([0.1] * len(xs)))
+
+
+@given(
+    st.lists(st.floats(-1e6, 1e6), min_size=1, max_size=10),
+    st.lists(
+        st.tuples(
+            st.integers(0, 9),
+            st.floats(-1e6, 1e6) | st.sampled_from([math.inf, -math.inf]),
+        )
+        | st.tuples(st.integers(0, 9), st.just(math.nan)),
+    ),
+)
+def test_aggregate_nonfinite(
+    initial: list[float],
+    updates: list[tuple[int, float]],
+):
+    xs = [rx(x) for x in initial]
+    total, mean = rx_sum(*xs), rx_mean(*xs)
+
+    for i, value in updates:
+        xs[i % len(xs)].__rx_set__(value)
+        values = [float(x) for x in xs]
+        if all(map(math.isfinite, values)):
+            expected = math.fsum(values)
+        else:
+            expected = sum(values)
+
+        assert float(total) == pytest.approx(expected, nan_ok=True)
+        assert float(mean) == pytest.approx(
+            expected / len(values),
+            nan_ok=True,
+        )
+
+
+def test_aggregate_overflow():
+    a, b = rx(1e308), rx(1e308)
+    total = rx_sum(a, b)
+    assert float(total) == math.inf
+
+    a.__rx_set__(0.0)
+    assert float(total) == 1e308
@@ -0,0 +1,115 @@
+# pyright: reportPrivateUsage=false, reportUnusedFunction=false
+from collections.abc import Generator
+
+import pytest
+
+from rxio import (
+    effect,
+    memory_budget,
+    pin,
+    rx,
+    rx_rolling_mean,
+    rx_sum,
+    unpin,
+)
+from rxio.rx import RxMap, _cache  # noqa: PLC2701
+
+
+@pytest.fixture()
+def _zero_budget() -> Generator[None, None, None]:
+    memory_budget(0)
+    try:
+        yield
+    finally:
+        memory_budget(None)
+
+
+@pytest.mark.usefixtures('_zero_budget')
+def test_evict():
+    calls: list[int] = []
+
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    a = rx(1)
+    b = RxMap(double, a)
+    c = pin(b + 1)
+
+    a.__rx_set__(2)
+    assert int(c) == int(a) * 2 + 1
+    calls.clear()
+
+    # the value of `b` is evicted, but `c` remains cached
+    assert b.__rx_state__.get() is Ellipsis
+    assert int(c) == int(a) * 2 + 1
+    assert not calls
+
+    # recomputing `b` doesn't invalidate `c`
+    assert int(b) == int(a) * 2
+    assert calls == [2]
+    assert c.__rx_state__.get() is not Ellipsis
+
+    # changes propagate through evicted nodes
+    memory_budget(0)
+    assert b.__rx_state__.get() is Ellipsis
+    a.__rx_set__(3)
+    assert int(c) == int(a) * 2 + 1
+
+
+@pytest.mark.usefixtures('_zero_budget')
+def test_pin():
+    a = rx(1)
+    b = pin(a * 2)
+    c = b + 1
+
+    a.__rx_set__(2)
+    assert int(c) == int(a) * 2 + 1
+    assert b.__rx_state__.get() is not Ellipsis
+
+    unpin(b)
+    int(b)
+    a.__rx_set__(3)
+    assert int(c) == int(a) * 2 + 1
+    assert b.__rx_state__.get() is Ellipsis
+
+
+@pytest.mark.usefixtures('_zero_budget')
+def test_evict_on_construction():
+    a = rx(1)
+    b = a * 2
+    assert _cache.total > 0
+
+    # constructing `c` evicts `b`, even though neither was read
+    c = b + 1
+    assert b.__rx_state__.get() is Ellipsis
+    assert int(c) == int(a) * 2 + 1
+
+    # the values of projections, aggregates, and rolling windows are tracked
+    s = rx(('x' * 1000, 0))
+    field = pin(s[0])
+    assert _cache.total >= 1000
+    unpin(field)
+
+    total = rx_sum(a, b)
+    mean = rx_rolling_mean(total, 2)
+    assert total.__rx_state__.get() is Ellipsis
+    assert float(mean) == int(a) + int(b)
+    a.__rx_set__(2)
+    assert int(total) == int(a) * 3
+    assert mean.__rx_state__.get() is Ellipsis
+    assert float(mean) == (3 + 6) / 2
+
+
+@pytest.mark.usefixtures('_zero_budget')
+def test_effect_not_tracked():
+    a = rx(1)
+    values: list[int] = []
+    e = effect(values.append, a)
+    assert _cache.total == 0
+
+    # an effect is never evicted, so its value isn't tracked
+    a.__rx_set__(2)
+    assert values == [1, 2]
+    assert _cache.total == 0
+    e.dispose()
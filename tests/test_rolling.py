@@ -0,0 +1,100 @@
+import statistics
+
+import pytest
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from rxio import (
+    rx,
+    rx_ewma,
+    rx_rolling_max,
+    rx_rolling_mean,
+    rx_rolling_min,
+    rx_rolling_var,
+)
+
+
+@given(
+    st.lists(st.integers(-100, 100), min_size=1, max_size=50),
+    st.integers(1, 10),
+    st.integers(1, 10),
+)
+def test_rolling(values: list[int], window: int, history: int):
+    x = rx(values[0], history=history)
+    seen = values[:1]
+    for value in values[1:history]:
+        if x.__rx_set__(value):
+            seen.append(value)
+
+    rolling = {
+        statistics.fmean: rx_rolling_mean(x, window),
+        min: rx_rolling_min(x, window),
+        max: rx_rolling_max(x, window),
+    }
+    var = rx_rolling_var(x, window)
+
+    for value in values[history:]:
+        if x.__rx_set__(value):
+            seen.append(value)
+
+        last = seen[-window:]
+        for func, node in rolling.items():
+            assert node.__rx_get__() == pytest.approx(func(last))
+        if len(last) > 1:
+            assert float(var) == pytest.approx(statistics.variance(last))
+
+
+def test_rolling_float_error():
+    x = rx(1e9)
+    mean, var = rx_rolling_mean(x, 3), rx_rolling_var(x, 3)
+    for i in range(2000):
+        x.__rx_set__(float(i % 3))
+
+    # the large value no longer affects the window
+    assert float(mean) == pytest.approx(1.0)
+    assert float(var) == pytest.approx(1.0)
+
+
+def test_ewma():
+    x = rx(1.0)
+    y = rx_ewma(x + 1, 0.5)
+    assert float(y) == float(x) + 1
+
+    x.__rx_set__(3.0)
+    assert float(y) == (2 + 4) / 2
+
+
+def test_history_item_at():
+    x = rx('a', history=2)
+    x.__rx_set__('b')
+    x.__rx_set__('c')
+
+    state = x.__rx_state__
+    assert state.item_at(2) == (2, 'c')
+    assert state.item_at(1) == (1, 'b')
+    with pytest.raises(KeyError):
+        state.item_at(0)
+    with pytest.raises(KeyError):
+        state.item_at(3)
+
+
+@pytest.mark.parametrize('pull_input_first', [False, True])
+def test_rolling_exception(pull_input_first: bool):
+    s = rx(1)
+    x = 1 / s
+    m = rx_rolling_mean(x, 2)
+    assert float(m) == 1.0
+
+    s.__rx_set__(0)
+    if pull_input_first:
+        with pytest.raises(ZeroDivisionError):
+            float(x)
+    with pytest.raises(ZeroDivisionError):
+        float(m)
+    with pytest.raises(ZeroDivisionError):
+        float(m)
+
+    s.__rx_set__(2)
+    assert float(m) == (1 + 1 / 2) / 2
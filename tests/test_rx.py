@@ -0,0 +1,197 @@
+# pyright: reportPrivateUsage=false
+import threading
+
+import pytest
+
+from rxio import batch, effect, interning, parallel, rx
+from rxio.rx import RxMap
+
+
+def test_exception_is_cached():
+    calls: list[int] = []
+
+    def recip(x: int) -> float:
+        calls.append(x)
+        return 1 / x
+
+    a = rx(1)
+    b = RxMap(recip, a)
+    c = b + 1
+    assert calls == [1]
+
+    a.__rx_set__(0)
+    for _ in range(3):
+        with pytest.raises(ZeroDivisionError):
+            float(c)
+    assert calls == [1, 0]
+
+    a.__rx_set__(2)
+    assert float(c) == 1 / 2 + 1
+    assert calls == [1, 0, 2]
+
+
+def test_exception_group():
+    a, b = rx(1), rx(1)
+    c = (1 / a) + (1 / b)
+
+    a.__rx_set__(0)
+    b.__rx_set__(0)
+    exc_info: pytest.ExceptionInfo[ExceptionGroup[Exception]]
+    with pytest.raises(ExceptionGroup) as exc_info:
+        float(c)
+
+    errors = exc_info.value.exceptions
+    assert len(errors) == 2
+    assert all(isinstance(e, ZeroDivisionError) for e in errors)
+
+    b.__rx_set__(2)
+    with pytest.raises(ZeroDivisionError):
+        float(c)
+
+
+def test_effect_batch():
+    a, b = rx(1), rx(2)
+    c = a * b
+    d = a + b
+    calls: list[int] = []
+    e = effect(calls.append, c)
+    assert calls == [2]
+
+    with batch():
+        a.__rx_set__(3)
+        b.__rx_set__(4)
+        a.__rx_set__(5)
+    assert calls == [2, 20]
+
+    # `d` isn't observed by any effect, so it remains lazy
+    assert d.__rx_state__.get() is Ellipsis
+
+    e.dispose()
+    a.__rx_set__(6)
+    assert calls == [2, 20]
+
+
+def test_effect_failure():
+    def recip(x: int) -> float:
+        return 1 / x
+
+    a, w = rx(1), rx(1)
+    e = effect(recip, a)
+    assert e.exception() is None
+
+    def write_and_fail() -> None:
+        with batch():
+            w.__rx_set__(2)
+            a.__rx_set__(1)
+            a.__rx_set__(0)
+            raise RuntimeError
+
+    # the failing effect isn't raised to the writer
+    a.__rx_set__(0)
+    assert isinstance(e.exception(), ZeroDivisionError)
+
+    # nor does it replace the exception that was raised within the batch
+    with pytest.raises(RuntimeError):
+        write_and_fail()
+    assert int(w) == 2
+    assert isinstance(e.exception(), ZeroDivisionError)
+
+    a.__rx_set__(2)
+    assert e.exception() is None
+    e.dispose()
+
+
+def test_interning():
+    a, b = rx(2), rx(3)
+    with interning():
+        ab = a * b
+        c0 = a * b + 1
+        c1 = a * b + 1
+        c2 = a * b + True
+        d = a * a
+        e = 2 * a
+
+    assert c0 is c1
+    assert c0 is not c2
+    assert d is not e
+    assert set(a.__rx_out__) == {ab, d, e}
+
+    a.__rx_set__(4)
+    assert int(c1) == int(c0)
+    assert int(c2) == int(c0)
+
+
+def test_interning_constants():
+    x, f = rx(-1.0), rx(repr)
+    with interning():
+        y0, y1 = x * 0.0, x * -0.0
+        s0, s1 = f((1,)), f((True,))
+
+    # equal, but not interchangeable
+    assert y0 is not y1
+    assert (str(y0), str(y1)) == ('-0.0', '0.0')
+    assert s0 is not s1
+    assert (str(s0), str(s1)) == ('(1,)', '(True,)')
+
+
+def test_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(x: int) -> int:
+        if x:
+            # only passes if both parents are pulled concurrently
+            barrier.wait()
+        return x
+
+    a = rx(0)
+    b, c = RxMap(wait, a), RxMap(wait, a + 1 - 1)
+    d = b + c
+
+    a.__rx_set__(1)
+    with parallel():
+        assert int(d) == int(a) * 2
+
+
+def test_parallel_shared_ancestor():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(x: int) -> int:
+        if x:
+            barrier.wait()
+        return x
+
+    def f(*xs: int) -> int:
+        return sum(xs)
+
+    a = rx(0)
+    s = a + 0
+    u1, u2 = RxMap(wait, a), RxMap(wait, a * 1)
+    b = RxMap(f, s, u1, u2)
+    # the parents of `d` share `s`, but those of `b` are independent
+    d = b + s
+
+    a.__rx_set__(1)
+    with parallel():
+        assert int(d) == 4
+
+
+def test_parallel_grouped_once(monkeypatch: pytest.MonkeyPatch):
+    groupings: list[RxMap[int]] = []
+    group_dirty = RxMap[int]._group_dirty  # noqa: SLF001
+
+    def spy(self: RxMap[int]) -> object:
+        groupings.append(self)
+        return group_dirty(self)
+
+    monkeypatch.setattr(RxMap, '_group_dirty', spy)
+
+    a = rx(0)
+    x = a + 0
+    for _ in range(10):
+        x = (x + 1) + (x - 1)
+
+    a.__rx_set__(1)
+    with parallel():
+        assert int(x) == 2**10
+    # the nodes that are pulled afterwards don't regroup the subgraph
+    assert groupings == [x]
@@ -0,0 +1,85 @@
+import math
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from rxio import rx, rx_evaluate
+from rxio.rx import RxMap
+
+
+if TYPE_CHECKING:
+    from rxio.rx import Rx
+
+
+np = pytest.importorskip('numpy')
+
+
+def test_evaluate_vectorized():
+    a, b = rx(3), rx(4)
+    c = (a**2 + b**2)**0.5
+
+    xs = np.arange(5)
+    ys = np.arange(3)[:, None]
+    out = rx_evaluate(c, {a: xs, b: ys})
+
+    assert out.shape == (len(ys), len(xs))
+    assert np.allclose(out, np.hypot(xs, ys))
+
+    # the state of the graph is unchanged
+    assert float(c) == math.hypot(3, 4)
+
+
+def test_evaluate_per_scenario():
+    calls: list[float] = []
+
+    def sqrt(x: float) -> float:
+        calls.append(x)
+        return math.sqrt(x)
+
+    a = rx(4.0)
+    b = RxMap(sqrt, a * a) + RxMap(sqrt, 9.0)
+    calls.clear()
+
+    out = rx_evaluate(b, {a: np.array([1.0, 2.0])})
+    assert out.tolist() == [4.0, 5.0]
+    assert calls == [1.0, 4.0]
+
+
+def test_evaluate_derived_input():
+    a = rx(1)
+    b = a + 1
+    c = b * 2
+
+    out = rx_evaluate(c, {b: np.array([10, 20])})
+    assert out.tolist() == [20, 40]
+
+
+def test_evaluate_python_semantics():
+    a = rx(1)
+
+    out = rx_evaluate(a**-1, {a: np.array([1, 2])})
+    assert out.tolist() == [1.0, 0.5]
+
+    # no integer overflow
+    big = 10**10
+    out = rx_evaluate(a * a, {a: np.array([big, 2])})
+    assert out.tolist() == [big * big, 4]
+
+    with pytest.raises(ZeroDivisionError):
+        rx_evaluate(1 / a, {a: np.array([1, 0])})
+    with pytest.raises(ZeroDivisionError):
+        rx_evaluate(1 / a, {a: np.array([1.0, 0.0])})
+
+    t = rx(True)
+    assert rx_evaluate(t + t, {t: np.array([True, False])}).tolist() == [2, 0]
+
+
+def test_evaluate_sequences():
+    a: Rx[Any] = rx(1)
+    out = rx_evaluate(a * (1, 2), {a: np.array([2, 3])})
+    assert out.tolist() == [(1, 2, 1, 2), (1, 2, 1, 2, 1, 2)]
+
+    t = rx((0, 0))
+    ts = np.empty(2, dtype=object)
+    ts[:] = [(1, 2), (2, 1)]
+    assert rx_evaluate(t == (1, 2), {t: ts}).tolist() == [True, False]
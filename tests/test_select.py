@@ -0,0 +1,85 @@
+from dataclasses import dataclass, replace
+from typing import NamedTuple
+
+import pytest
+
+from rxio import rx
+from rxio.rx import RxMap
+
+
+@dataclass(frozen=True)
+class Quote:
+    symbol: str
+    bid: float
+    ask: float
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def test_getattr_cutoff():
+    quote = rx(Quote('SPAM', 1.0, 2.0))
+    calls: list[str] = []
+    symbol = RxMap(calls.append, quote.symbol)
+    spread = quote.ask - quote.bid
+
+    assert repr(quote.bid) == f'{quote!r}.bid'
+    assert float(spread) == 1
+
+    quote.__rx_set__(replace(quote.__rx_get__(), bid=1.5))
+    assert symbol.__rx_state__.get() is not Ellipsis
+    assert float(spread) == quote.__rx_get__().ask - quote.__rx_get__().bid
+    assert calls == ['SPAM']
+
+    quote.__rx_set__(replace(quote.__rx_get__(), symbol='HAM'))
+    symbol.__rx_get__()
+    assert calls == ['SPAM', 'HAM']
+
+
+def test_getitem_cutoff():
+    p = rx(Point(1, 2))
+    x, y = p[0], p.y
+    x2 = x * 2
+
+    assert repr(x) == f'{p!r}[0]'
+    p.__rx_set__(Point(1, 3))
+    assert x2.__rx_state__.get() is not Ellipsis
+    assert int(y) == p.__rx_get__().y
+
+    p.__rx_set__(Point(4, 3))
+    assert int(x2) == p.__rx_get__().x * 2
+
+
+def test_getattr_private():
+    p = rx(Point(1, 2))
+    with pytest.raises(AttributeError):
+        _ = p._fields
+    with pytest.raises(AttributeError):
+        _ = p.z
+
+
+def test_getattr_missing():
+    x = rx(1.5)
+    assert not hasattr(x, 'spam')
+    assert hasattr(x, 'real')
+    # the projection is reused, instead of subscribing a new one
+    assert x.real is x.real
+    assert len(x.__rx_out__) == 1
+
+
+def test_evaluate_projection():
+    np = pytest.importorskip('numpy')
+    from rxio import rx_evaluate  # noqa: PLC0415
+
+    a = rx(1.0)
+    quote = RxMap(Quote, 'SPAM', a, a + 1)
+    out = rx_evaluate(quote.ask - quote.bid, {a: np.array([1.0, 2.0])})
+    assert out.tolist() == [1.0, 1.0]
+
+    t = rx((1, 2))
+    ts = np.empty(2, dtype=object)
+    ts[:] = [(1, 2), (3, 4)]
+    # not the second scenario
+    assert rx_evaluate(t[1], {t: ts}).tolist() == [2, 4]
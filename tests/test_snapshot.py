@@ -0,0 +1,170 @@
+# pyright: reportPrivateUsage=false
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from rxio import effect, rx, rx_rolling_mean, rx_sum, snapshot
+from rxio._mvcc import VersionStore  # noqa: PLC2701
+from rxio.rx import RxMap, _versions  # noqa: PLC2701
+
+
+def _write(func: Callable[[], object]) -> None:
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+def test_isolation():
+    a, b = rx(1), rx(2)
+    c = a + b
+
+    def writer() -> None:
+        a.__rx_set__(10)
+        b.__rx_set__(20)
+
+    with snapshot():
+        _write(writer)
+        assert (int(a), int(b), int(c)) == (1, 2, 1 + 2)
+
+    assert (int(a), int(b), int(c)) == (10, 20, 10 + 20)
+
+
+def test_nested_and_gc():
+    a = rx(1)
+    with snapshot():
+        a.__rx_set__(2)
+        with snapshot():
+            a.__rx_set__(3)
+            assert int(a) == 2
+        assert int(a) == 1
+        # only the versions that the outer snapshot needs are retained
+        chain = _versions._chains[id(a)][1]  # noqa: SLF001
+        assert len(chain) == 3
+
+    assert not _versions._chains  # noqa: SLF001
+    assert int(a) == 3
+
+
+def test_computed_once():
+    calls: list[int] = []
+
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    a = rx(1)
+    b = RxMap(double, a)
+    calls.clear()
+
+    with snapshot():
+        a.__rx_set__(2)
+        assert int(b) == int(a) * 2
+        assert int(b) == int(a) * 2
+    assert calls == [1]
+
+    # the live cache isn't affected
+    assert b.__rx_state__.get() is Ellipsis
+    assert int(b) == int(a) * 2
+
+
+def test_aggregate_and_rolling():
+    xs = [rx(i) for i in range(4)]
+    total = rx_sum(*xs)
+    mean = rx_rolling_mean(xs[0], 2)
+
+    with snapshot():
+        _write(lambda: xs[0].__rx_set__(10))
+        assert int(total) == sum(range(4))
+        # the rolling window isn't versioned
+        assert float(mean) == (0 + 10) / 2
+
+    assert int(total) == sum(range(4)) + 10
+
+
+def test_failure():
+    a = rx(1)
+    b = 1 / a
+
+    with snapshot():
+        a.__rx_set__(0)
+        assert float(b) == 1.0
+
+    with snapshot():
+        with pytest.raises(ZeroDivisionError):
+            float(b)
+        a.__rx_set__(1)
+        with pytest.raises(ZeroDivisionError):
+            float(b)
+
+
+def test_effect_within_snapshot():
+    seen: list[int] = []
+    a = rx(1)
+    e = effect(seen.append, a)
+
+    with snapshot():
+        a += 1
+        a += 1
+        assert int(a) == 1
+
+    assert seen == [1, 2, 3]
+    e.dispose()
+
+
+def test_reuse_live_values():
+    calls: list[int] = []
+
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    a, b = rx(1), rx(2)
+    c = RxMap(double, a)
+    total = rx_sum(c, b)
+    calls.clear()
+
+    for _ in range(3):
+        with snapshot():
+            assert int(total) == int(a) * 2 + int(b)
+    assert not calls
+
+    # only the nodes with different inputs are recomputed
+    with snapshot():
+        _write(lambda: b.__rx_set__(3))
+        assert int(total) == 1 * 2 + 2
+    assert not calls
+
+    with snapshot():
+        _write(lambda: a.__rx_set__(4))
+        assert int(c) == 1 * 2
+    assert calls == [1]
+
+
+def test_versioned_before_visible():
+    store = VersionStore()
+    seen: list[int] = []
+
+    class State:
+        @staticmethod
+        def get() -> Any:
+            return 0
+
+        @staticmethod
+        def set(value: Any, /) -> tuple[int, bool]:
+            # the new value becomes visible to readers here
+            seen.append(store.version)
+            return 1, value != 0
+
+    class Var:
+        __rx_state__: Any = State()
+
+    version = store.open()
+    with store.write(Var(), 1) as changed:
+        assert changed
+    with store.write(Var(), 0) as changed:
+        assert not changed
+    assert seen == [version + 1, version + 2]
+    assert store.version == version + 1
+    store.close(version)